@@ -0,0 +1,42 @@
+"""
+Console entry point for Forge
+
+``forge switch <branch>`` is served here with plain print() so it never
+imports Typer, click, rich or the config stack; every other invocation is
+handed to the Typer app in forge.cli.
+"""
+
+import sys
+
+
+def _switch(branch_name: str) -> int:
+    """Fast path for 'forge switch <branch>'; returns the exit code"""
+    from forge.core.git_ops import find_repo_root, switch_branch
+    
+    repo_root = find_repo_root()
+    if repo_root is None:
+        print("Error: Not in a Git repository", file=sys.stderr)
+        return 1
+    
+    try:
+        switch_branch(branch_name, repo_root)
+    except (ValueError, RuntimeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    
+    print(f"✓ Switched to branch {branch_name}")
+    return 0
+
+
+def main():
+    """Run the fast path for trivial commands, otherwise the full Typer CLI"""
+    args = sys.argv[1:]
+    if len(args) == 2 and args[0] == "switch" and not args[1].startswith("-"):
+        sys.exit(_switch(args[1]))
+    
+    from forge.cli import main as cli_main
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,57 @@
 """Pytest adapter for Python test generation"""
 
 import os
+import re
+import shutil
 import subprocess
+import sys
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from forge.adapters.base import LanguageAdapter
-from forge.core.diff import filter_source_files
+from forge.core.diff import compile_patterns, filter_source_files
+
+# Files whose presence marks a Python project without walking the tree
+_PROJECT_MARKERS = (
+    "pyproject.toml",
+    "setup.py",
+    "setup.cfg",
+    "requirements.txt",
+    "Pipfile",
+    "poetry.lock",
+    "tox.ini",
+)
+
+_PY_EXTENSIONS = (".py",)
+
+# Exclude patterns applied to changed files and (by default) to the full tree
+_CHANGED_FILE_EXCLUDES = ("venv/", "node_modules/", "__pycache__/", ".git/", "tests/")
+_DEFAULT_EXCLUDES = _CHANGED_FILE_EXCLUDES + ("test/",)
+
+# Directories that never contain source files worth generating tests for
+_PRUNED_DIRS = frozenset({"venv", "node_modules", "__pycache__", ".git", "tests", "test"})
 
 
 class PythonPytestAdapter(LanguageAdapter):
     """Adapter for Python projects using pytest"""
     
+    def __init__(self):
+        # Tree walks are memoized per (repo_root, root mtime) so one CLI
+        # invocation walks the repository at most once
+        self._detect_cache: dict[tuple, bool] = {}
+        self._files_cache: dict[tuple, list[str]] = {}
+    
     def detect(self, repo_root: Path) -> bool:
         """Detect if this is a Python project"""
-        python_files = list(repo_root.rglob("*.py"))
-        return len(python_files) > 0
+        # Packaging files answer the question with a single stat each
+        if any((repo_root / marker).exists() for marker in _PROJECT_MARKERS):
+            return True
+        
+        key = (str(repo_root), os.stat(repo_root).st_mtime_ns)
+        if key not in self._detect_cache:
+            self._detect_cache[key] = next(_iter_py_files(str(repo_root)), None) is not None
+        return self._detect_cache[key]
     
     def get_changed_files(
         self,
@@ -24,14 +61,19 @@ class PythonPytestAdapter(LanguageAdapter):
         """Get changed Python files"""
         from forge.core.git_ops import get_changed_files_since_base
         
-        changed_files = get_changed_files_since_base(base_branch, repo_root)
+        # git narrows the diff to Python files itself
+        changed_files = get_changed_files_since_base(
+            base_branch,
+            repo_root,
+            pathspecs=[f"*{extension}" for extension in _PY_EXTENSIONS],
+        )
         
         # Filter to Python files only
         python_files = filter_source_files(
             changed_files,
-            include_patterns=[],
-            exclude_patterns=["venv/", "node_modules/", "__pycache__/", ".git/", "tests/"],
-            extensions=[".py"],
+            include_patterns=(),
+            exclude_patterns=_CHANGED_FILE_EXCLUDES,
+            extensions=_PY_EXTENSIONS,
         )
         
         return python_files
@@ -44,42 +86,38 @@ class PythonPytestAdapter(LanguageAdapter):
     ) -> list[str]:
         """Get all Python source files in the repository"""
         if include_patterns is None:
-            include_patterns = []
+            include_patterns = ()
         if exclude_patterns is None:
-            exclude_patterns = ["venv/", "node_modules/", "__pycache__/", ".git/", "tests/", "test/"]
+            exclude_patterns = _DEFAULT_EXCLUDES
         
-        # Find all Python files
+        key = (
+            str(repo_root),
+            tuple(include_patterns),
+            tuple(exclude_patterns),
+            os.stat(repo_root).st_mtime_ns,
+        )
+        if key in self._files_cache:
+            return list(self._files_cache[key])
+        
+        exclude_re = compile_patterns(exclude_patterns)
+        include_re = compile_patterns(include_patterns)
+        
+        # Find all Python files (test directories are never descended into)
         all_python_files = []
-        for py_file in repo_root.rglob("*.py"):
-            # Get relative path from repo root
-            rel_path = str(py_file.relative_to(repo_root))
-            
-            # Always exclude test directories and test files
-            if rel_path.startswith("tests/") or rel_path.startswith("test/"):
-                continue
-            
+        for rel_path in _iter_py_files(str(repo_root), exclude_re):
             # Check exclude patterns
-            excluded = False
-            for pattern in exclude_patterns:
-                if pattern in rel_path:
-                    excluded = True
-                    break
-            if excluded:
+            if exclude_re and exclude_re.search(rel_path):
                 continue
             
             # Check include patterns (if any specified)
-            if include_patterns:
-                included = False
-                for pattern in include_patterns:
-                    if pattern in rel_path:
-                        included = True
-                        break
-                if not included:
-                    continue
+            if include_re and not include_re.search(rel_path):
+                continue
             
             all_python_files.append(rel_path)
         
-        return sorted(all_python_files)
+        all_python_files.sort()
+        self._files_cache[key] = all_python_files
+        return list(all_python_files)
     
     def get_test_file_path(
         self,
@@ -87,20 +125,19 @@ class PythonPytestAdapter(LanguageAdapter):
         test_dir: Path,
     ) -> Path:
         """Convert source file path to test file path"""
-        source_path = Path(source_file)
+        # Plain string arithmetic; only the result is a Path
+        split = max(source_file.rfind("/"), source_file.rfind(os.sep))
+        parent = source_file[:split] if split >= 0 else ""
+        base = source_file[split + 1:]
         
         # Remove .py extension and add test_ prefix
-        test_name = f"test_{source_path.stem}.py"
+        stem = base[:-3] if base.endswith(".py") else base
+        test_name = f"test_{stem}.py"
         
         # Maintain directory structure in tests/
-        if source_path.parent != Path("."):
-            # Preserve relative path structure
-            relative_path = source_path.parent
-            test_path = test_dir / relative_path / test_name
-        else:
-            test_path = test_dir / test_name
-        
-        return test_path
+        if parent and parent != ".":
+            return test_dir / parent / test_name
+        return test_dir / test_name
     
     def generate_tests(
         self,
@@ -113,8 +150,32 @@ class PythonPytestAdapter(LanguageAdapter):
         # The adapter just provides the interface
         raise NotImplementedError("Use test_service.generate_tests_for_file instead")
     
-    def run_tests(self, repo_root: Path, test_dir: Path) -> bool:
+    def run_tests(
+        self,
+        repo_root: Path,
+        test_dir: Path,
+        jobs: Optional[int] = None,
+    ) -> bool:
         """Run pytest tests and display all test results"""
+        return self.wait_tests(self.start_tests(repo_root, test_dir, jobs))
+    
+    def start_tests(
+        self,
+        repo_root: Path,
+        test_dir: Path,
+        jobs: Optional[int] = None,
+    ) -> "PytestRun":
+        """
+        Launch pytest without waiting for it to finish
+        
+        Tests run across ``jobs`` workers (default: cores - 2). pytest-xdist is
+        used when installed; otherwise the collected node IDs are sharded
+        across concurrent pytest processes. Pass the returned handle to
+        wait_tests() once any overlapping work is done.
+        """
+        if jobs is None:
+            jobs = default_jobs()
+        
         try:
             # Set PYTHONPATH to include repo root so imports work (e.g., "from src.module import ...")
             env = os.environ.copy()
@@ -124,20 +185,157 @@ class PythonPytestAdapter(LanguageAdapter):
             else:
                 env["PYTHONPATH"] = str(repo_root)
             
+            if jobs > 1 and not _pytest_has_xdist(env):
+                return self._start_sharded(repo_root, test_dir, env, jobs)
+            
             # Run pytest with verbose output to show all tests
             # -v: verbose (shows each test)
             # --tb=short: shorter traceback format
-            result = subprocess.run(
-                ["pytest", str(test_dir), "-v", "--tb=short"],
-                cwd=repo_root,
-                env=env,
-                capture_output=False,  # Don't capture so output is shown immediately
-                text=True,
-                check=False,
-            )
-            return result.returncode == 0
+            # Output is not captured so it is shown immediately
+            cmd = ["pytest", str(test_dir), "-v", "--tb=short"]
+            if jobs > 1:
+                cmd += ["-n", str(jobs)]
+            process = subprocess.Popen(cmd, cwd=repo_root, env=env, text=True)
+            return PytestRun([process])
         except FileNotFoundError:
             raise RuntimeError(
                 "pytest not found. Install it with: pip install pytest"
             )
+    
+    def wait_tests(self, run: "PytestRun") -> bool:
+        """Wait for a run started by start_tests and return True if all pass"""
+        return run.wait()
+    
+    def _start_sharded(
+        self,
+        repo_root: Path,
+        test_dir: Path,
+        env: dict,
+        jobs: int,
+    ) -> "PytestRun":
+        """Launch collected tests round-robin across ``jobs`` pytest processes"""
+        # Node IDs are relative to pytest's rootdir, which an ini file below
+        # repo_root would otherwise move; pin it so the IDs resolve from cwd
+        rootdir = f"--rootdir={repo_root}"
+        collected = subprocess.run(
+            ["pytest", str(test_dir), rootdir, "--collect-only", "-q"],
+            cwd=repo_root,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        lines = collected.stdout.splitlines()
+        node_ids = [line for line in lines if "::" in line]
+        
+        # Collection failed (e.g. a test module that does not import), or
+        # nothing worth splitting - run serially so pytest reports the errors
+        # the usual way and the run fails as it would unsharded
+        collection_failed = collected.returncode != 0 or any(
+            line.startswith("ERROR ") for line in lines
+        )
+        if collection_failed or len(node_ids) < 2:
+            return self.start_tests(repo_root, test_dir, jobs=1)
+        
+        shards = [node_ids[i::jobs] for i in range(min(jobs, len(node_ids)))]
+        
+        # Spool each shard's output to a temp file rather than a pipe so
+        # output is never held in memory and no process blocks on a full pipe
+        outputs = [tempfile.TemporaryFile(mode="w+") for _ in shards]
+        processes = []
+        try:
+            for shard, output in zip(shards, outputs):
+                processes.append(
+                    subprocess.Popen(
+                        ["pytest", rootdir, *shard, "-v", "--tb=short"],
+                        cwd=repo_root,
+                        env=env,
+                        stdout=output,
+                        stderr=subprocess.STDOUT,
+                        text=True,
+                    )
+                )
+        except BaseException:
+            PytestRun(processes, outputs).wait()
+            raise
+        
+        return PytestRun(processes, outputs)
+
+
+class PytestRun:
+    """Handle for an in-flight pytest run (one process per shard)"""
+    
+    def __init__(self, processes: list[subprocess.Popen], outputs: Optional[list] = None):
+        self.processes = processes
+        self.outputs = outputs or []
+    
+    def wait(self) -> bool:
+        """Wait for every process, replay spooled output, return True if all pass"""
+        try:
+            for process in self.processes:
+                process.wait()
+            
+            # Print in shard order to keep output deterministic
+            for output in self.outputs:
+                output.seek(0)
+                shutil.copyfileobj(output, sys.stdout)
+            sys.stdout.flush()
+        finally:
+            for output in self.outputs:
+                output.close()
+        
+        return all(process.returncode == 0 for process in self.processes)
+
+
+def _iter_py_files(root: str, exclude_re: Optional[re.Pattern] = None):
+    """
+    Yield .py file paths relative to ``root`` using an os.scandir walk
+
+    Works on plain strings and never descends into _PRUNED_DIRS. Directories
+    whose relative path already matches ``exclude_re`` are pruned too, since
+    every file beneath them would be excluded anyway.
+    """
+    prefix_len = len(os.path.join(root, ""))
+    stack = [root]
+    while stack:
+        top = stack.pop()
+        try:
+            with os.scandir(top) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in _PRUNED_DIRS:
+                            continue
+                        if exclude_re and exclude_re.search(entry.path[prefix_len:] + os.sep):
+                            continue
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".py"):
+                        yield entry.path[prefix_len:]
+        except OSError:
+            continue
+
+
+def default_jobs() -> int:
+    """Default number of pytest workers: all cores but two"""
+    return max(1, (os.cpu_count() or 1) - 2)
+
+
+def _pytest_has_xdist(env: dict) -> bool:
+    """Check whether the pytest that will run the tests has pytest-xdist"""
+    # Ask the pytest found on the run's PATH rather than this interpreter:
+    # Forge may be installed in a different environment than the project
+    pytest_path = shutil.which("pytest", path=env.get("PATH"))
+    if pytest_path is None:
+        return False
+    return _xdist_available(pytest_path)
+
 
+@lru_cache(maxsize=4)
+def _xdist_available(pytest_path: str) -> bool:
+    """Whether a pytest executable accepts -n (memoized per executable)"""
+    result = subprocess.run(
+        [pytest_path, "--help"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return "--numprocesses" in result.stdout
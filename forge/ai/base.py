@@ -1,5 +1,6 @@
 """Base AI provider interface"""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Optional
 from pydantic import BaseModel
@@ -17,6 +18,12 @@ class AIConfig(BaseModel):
 class AIProvider(ABC):
     """Base class for AI providers"""
     
+    # Providers with a fixed model list override this for O(1) validation
+    SUPPORTED_MODELS: frozenset[str] = frozenset()
+    
+    # Environment variable holding the provider's API key
+    API_KEY_ENV: Optional[str] = None
+    
     def __init__(self, config: AIConfig):
         """Initialize provider with configuration"""
         self.config = config
@@ -40,6 +47,21 @@ class AIProvider(ABC):
         """
         pass
     
+    async def agenerate_tests(self, prompt: str) -> str:
+        """
+        Generate test code from a prompt without blocking the event loop
+        
+        Runs generate_tests in a worker thread by default; providers with a
+        native async client should override this.
+        
+        Args:
+            prompt: The prompt containing code and instructions
+        
+        Returns:
+            Generated test code
+        """
+        return await asyncio.to_thread(self.generate_tests, prompt)
+    
     @abstractmethod
     def get_supported_models(self) -> list[str]:
         """Get list of supported models for this provider"""
@@ -47,5 +69,7 @@ class AIProvider(ABC):
     
     def validate_model(self, model: str) -> bool:
         """Validate that the model is supported"""
+        if self.SUPPORTED_MODELS:
+            return model in self.SUPPORTED_MODELS
         return model in self.get_supported_models()
 
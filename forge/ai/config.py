@@ -1,13 +1,16 @@
 """AI configuration parsing and resolution"""
 
 import os
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from forge.ai.base import AIConfig
-from forge.core.config import ForgeConfig
+from forge.ai.registry import get_provider
+
+if TYPE_CHECKING:
+    from forge.core.config import ForgeConfig
 
 
 def parse_ai_config(
-    forge_config: ForgeConfig,
+    forge_config: "ForgeConfig",
     provider_override: Optional[str] = None,
     model_override: Optional[str] = None,
     temperature_override: Optional[float] = None,
@@ -68,13 +71,14 @@ def parse_ai_config(
     
     # Get API key from environment (never from config)
     # Note: .env file should be loaded before this function is called
+    try:
+        provider_class = get_provider(provider)
+    except ImportError:
+        provider_class = None  # resolve_provider reports the import failure
+    
     api_key = None
-    if provider == "openai":
-        api_key = os.getenv("OPENAI_API_KEY")
-    elif provider == "anthropic":
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-    elif provider == "gemini":
-        api_key = os.getenv("GOOGLE_API_KEY")
+    if provider_class is not None and provider_class.API_KEY_ENV:
+        api_key = os.getenv(provider_class.API_KEY_ENV)
     
     return AIConfig(
         provider=provider,
@@ -6,74 +6,86 @@ from google import genai
 from forge.ai.base import AIProvider, AIConfig
 
 
+_SYSTEM_INSTRUCTION = "You are a Python testing expert. Generate minimal, readable pytest tests."
+
+# Clients keyed by API key, so every provider instance shares one connection pool
+_CLIENT_CACHE: dict[str, genai.Client] = {}
+
+
 class GeminiProvider(AIProvider):
     """Google Gemini provider for test generation"""
     
-    SUPPORTED_MODELS = [
+    SUPPORTED_MODELS = frozenset({
         "gemini-2.0-flash-lite",
         "gemini-1.5-pro",
         "gemini-1.5-flash",
         "gemini-pro",
         "gemini-1.0-pro",
         "gemini-2.0-flash-exp",
-    ]
+    })
+    
+    API_KEY_ENV = "GOOGLE_API_KEY"
     
     def __init__(self, config: AIConfig):
         """Initialize Gemini provider"""
         super().__init__(config)
         
-        api_key = config.api_key or os.getenv("GOOGLE_API_KEY")
+        api_key = config.api_key or os.getenv(self.API_KEY_ENV)
         if not api_key:
             raise ValueError(
-                "GOOGLE_API_KEY not found. "
+                f"{self.API_KEY_ENV} not found. "
                 "Set it as an environment variable or in config."
             )
         
-        self.client = genai.Client(api_key=api_key)
+        client = _CLIENT_CACHE.get(api_key)
+        if client is None:
+            client = _CLIENT_CACHE[api_key] = genai.Client(api_key=api_key)
+        self.client = client
     
     def _validate_config(self) -> None:
         """Validate Gemini-specific configuration"""
         if not self.validate_model(self.config.model):
             raise ValueError(
                 f"Unsupported model: {self.config.model}. "
-                f"Supported models: {', '.join(self.SUPPORTED_MODELS)}"
+                f"Supported models: {', '.join(self.get_supported_models())}"
             )
     
     def generate_tests(self, prompt: str) -> str:
         """Generate tests using Gemini API"""
         try:
-            # Build the full prompt with system instructions
-            full_prompt = f"""You are a Python testing expert. Generate minimal, readable pytest tests.
-
-{prompt}"""
-            
-            # Build generation config with optional parameters
-            # Note: GenerateContentConfig uses camelCase for parameter names
-            config_params = {}
-            if self.config.temperature is not None:
-                config_params["temperature"] = self.config.temperature
-            if self.config.max_tokens:
-                config_params["maxOutputTokens"] = self.config.max_tokens
-            
-            # Use the new API - temperature and other params go in config
-            if config_params:
-                generation_config = genai.types.GenerateContentConfig(**config_params)
-                response = self.client.models.generate_content(
-                    model=self.config.model,
-                    contents=full_prompt,
-                    config=generation_config,
-                )
-            else:
-                response = self.client.models.generate_content(
-                    model=self.config.model,
-                    contents=full_prompt,
-                )
-            
+            response = self.client.models.generate_content(**self._build_request(prompt))
             return response.text.strip()
         except Exception as e:
             raise RuntimeError(f"Gemini API error: {e}")
     
+    async def agenerate_tests(self, prompt: str) -> str:
+        """Generate tests using Gemini's native async client"""
+        try:
+            response = await self.client.aio.models.generate_content(
+                **self._build_request(prompt)
+            )
+            return response.text.strip()
+        except Exception as e:
+            raise RuntimeError(f"Gemini API error: {e}")
+    
+    def _build_request(self, prompt: str) -> dict:
+        """Build generate_content keyword arguments for a prompt"""
+        # The system instruction travels in the config rather than being
+        # prepended to every prompt, so the prompt is sent verbatim and the
+        # shared prefix can be cached server-side
+        config_params = {"system_instruction": _SYSTEM_INSTRUCTION}
+        if self.config.temperature is not None:
+            config_params["temperature"] = self.config.temperature
+        if self.config.max_tokens:
+            config_params["max_output_tokens"] = self.config.max_tokens
+        
+        return {
+            "model": self.config.model,
+            "contents": prompt,
+            "config": genai.types.GenerateContentConfig(**config_params),
+        }
+    
     def get_supported_models(self) -> list[str]:
         """Get list of supported Gemini models"""
-        return self.SUPPORTED_MODELS.copy()
+        return sorted(self.SUPPORTED_MODELS)
 
@@ -6,37 +6,46 @@ import openai
 from forge.ai.base import AIProvider, AIConfig
 
 
+# Clients keyed by API key, so every provider instance shares one connection pool
+_CLIENT_CACHE: dict[str, openai.OpenAI] = {}
+
+
 class OpenAIProvider(AIProvider):
     """OpenAI provider for test generation"""
     
-    SUPPORTED_MODELS = [
+    SUPPORTED_MODELS = frozenset({
         "gpt-4-turbo-preview",
         "gpt-4",
         "gpt-4o",
         "gpt-4o-mini",
         "gpt-4-mini",  # Alias for gpt-4o-mini
         "gpt-3.5-turbo",
-    ]
+    })
+    
+    API_KEY_ENV = "OPENAI_API_KEY"
     
     def __init__(self, config: AIConfig):
         """Initialize OpenAI provider"""
         super().__init__(config)
         
-        api_key = config.api_key or os.getenv("OPENAI_API_KEY")
+        api_key = config.api_key or os.getenv(self.API_KEY_ENV)
         if not api_key:
             raise ValueError(
-                "OPENAI_API_KEY not found. "
+                f"{self.API_KEY_ENV} not found. "
                 "Set it as an environment variable or in config."
             )
         
-        self.client = openai.OpenAI(api_key=api_key)
+        client = _CLIENT_CACHE.get(api_key)
+        if client is None:
+            client = _CLIENT_CACHE[api_key] = openai.OpenAI(api_key=api_key)
+        self.client = client
     
     def _validate_config(self) -> None:
         """Validate OpenAI-specific configuration"""
         if not self.validate_model(self.config.model):
             raise ValueError(
                 f"Unsupported model: {self.config.model}. "
-                f"Supported models: {', '.join(self.SUPPORTED_MODELS)}"
+                f"Supported models: {', '.join(self.get_supported_models())}"
             )
     
     def generate_tests(self, prompt: str) -> str:
@@ -63,5 +72,5 @@ class OpenAIProvider(AIProvider):
     
     def get_supported_models(self) -> list[str]:
         """Get list of supported OpenAI models"""
-        return self.SUPPORTED_MODELS.copy()
+        return sorted(self.SUPPORTED_MODELS)
 
@@ -1,14 +1,15 @@
 """AI provider registry and resolution"""
 
-from typing import Optional, Type, Dict
+import importlib
+from typing import Optional, Type, Dict, Union
 from forge.ai.base import AIProvider, AIConfig
-from forge.ai.openai import OpenAIProvider
-from forge.ai.gemini import GeminiProvider
 
 # Registry of available providers
-PROVIDERS: Dict[str, Type[AIProvider]] = {
-    "openai": OpenAIProvider,
-    "gemini": GeminiProvider,
+# Built-in providers are "module:Class" strings imported on first use, so an
+# SDK is only loaded when its provider is actually selected
+PROVIDERS: Dict[str, Union[str, Type[AIProvider]]] = {
+    "openai": "forge.ai.openai:OpenAIProvider",
+    "gemini": "forge.ai.gemini:GeminiProvider",
 }
 
 
@@ -18,8 +19,14 @@ def register_provider(name: str, provider_class: Type[AIProvider]) -> None:
 
 
 def get_provider(name: str) -> Optional[Type[AIProvider]]:
-    """Get a provider class by name"""
-    return PROVIDERS.get(name.lower())
+    """Get a provider class by name, importing it on first use"""
+    name = name.lower()
+    provider = PROVIDERS.get(name)
+    if isinstance(provider, str):
+        module_name, class_name = provider.split(":")
+        provider = getattr(importlib.import_module(module_name), class_name)
+        PROVIDERS[name] = provider
+    return provider
 
 
 def resolve_provider(config: AIConfig) -> AIProvider:
@@ -35,7 +42,10 @@ def resolve_provider(config: AIConfig) -> AIProvider:
     Raises:
         ValueError: If provider is not found or invalid
     """
-    provider_class = get_provider(config.provider)
+    try:
+        provider_class = get_provider(config.provider)
+    except ImportError as e:
+        raise ValueError(f"Failed to load provider {config.provider}: {e}")
     
     if provider_class is None:
         available = ", ".join(PROVIDERS.keys())
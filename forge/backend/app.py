@@ -1,24 +1,30 @@
 """FastAPI backend for Forge dashboard"""
 
+import asyncio
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
-from fastapi import FastAPI, HTTPException, Depends
+from typing import Optional
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Depends, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, Response, StreamingResponse
+import orjson
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import exists, func, lambda_stmt, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from forge.database.models import (
     Repository,
     Branch,
     Commit,
     TestEvent,
-    get_session,
+    get_async_session,
+    get_scoped_session,
     init_db,
 )
-from forge.database.scanner import scan_repository
+from forge.database.scanner import register_repository, scan_repository
 
-app = FastAPI(title="Forge API", version="0.1.0")
+app = FastAPI(title="Forge API", version="0.1.0", default_response_class=ORJSONResponse)
 
 # CORS middleware for React frontend
 app.add_middleware(
@@ -87,6 +93,10 @@ class TestEventResponse(BaseModel):
         from_attributes = True
 
 
+class BranchWithMetricsResponse(BranchResponse):
+    has_generated_tests: bool
+
+
 class BranchMetrics(BaseModel):
     commits_behind_base: int
     days_since_last_sync: Optional[float]
@@ -97,13 +107,102 @@ class AddRepositoryRequest(BaseModel):
     local_path: str
 
 
-# Dependency to get database session
-def get_db():
-    session = get_session()
+class PydanticResponse(JSONResponse):
+    """
+    JSON response rendered by Pydantic's own serializer
+    
+    Returning this directly skips FastAPI's response_model re-validation and
+    jsonable_encoder pass; the route's response_model still documents the
+    schema. Anything that is not a model is encoded with orjson.
+    """
+    
+    def render(self, content) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode()
+        return orjson.dumps(content)
+
+
+def _columns(model, response_model: type[BaseModel]) -> list:
+    """ORM columns matching a response model's fields, in field order"""
+    return [getattr(model, name) for name in response_model.model_fields]
+
+
+def _pack(response_model: type[BaseModel], row) -> BaseModel:
+    """Build a response model from a trusted DB row without re-validating it"""
+    return response_model.model_construct(**row._mapping)
+
+
+# Pre-serialized bodies of list endpoints that only change when a repository
+# is added or scanned, keyed by endpoint and parameters. Entries expire after
+# a few seconds so writes made by the CLI still show up promptly.
+_RESPONSE_CACHE_TTL = 5.0
+_RESPONSE_CACHE_MAXSIZE = 128
+_response_cache: dict[tuple, tuple[float, bytes]] = {}
+
+
+def _cached_response(key: tuple) -> Optional[Response]:
+    """Return the cached JSON response for key, if present and fresh"""
+    entry = _response_cache.get(key)
+    if entry is None or entry[0] < time.monotonic():
+        return None
+    return Response(content=entry[1], media_type="application/json")
+
+
+def _cache_response(key: tuple, content) -> Response:
+    """Serialize content, cache the body under key and return it as a response"""
+    if len(_response_cache) >= _RESPONSE_CACHE_MAXSIZE:
+        _response_cache.pop(next(iter(_response_cache)))
+    body = orjson.dumps(content)
+    _response_cache[key] = (time.monotonic() + _RESPONSE_CACHE_TTL, body)
+    return Response(content=body, media_type="application/json")
+
+
+async def _scan_and_invalidate(repo_path: Path) -> None:
+    """Scan a repository, then drop cached responses that may now be stale"""
+    # The scan runs on a worker thread, but the cache is only ever touched
+    # from the event loop so eviction in _cache_response cannot race a clear
     try:
-        yield session
+        await asyncio.to_thread(scan_repository, repo_path)
     finally:
-        session.close()
+        _response_cache.clear()
+
+
+# Per-branch metric columns shared by the single and bulk metric queries.
+# Days since last sync is computed by SQLite as a float (NULL if never
+# synced); timestamps are stored as UTC, which is what 'now' means there.
+_DAYS_SINCE_SYNC = (
+    func.julianday("now") - func.julianday(Branch.last_synced_at)
+).label("days_since_last_sync")
+_HAS_GENERATED_TESTS = (
+    exists()
+    .where(TestEvent.branch_id == Branch.id, TestEvent.status == "success")
+    .label("has_generated_tests")
+)
+_METRIC_COLUMNS = (Branch.commits_behind_base, _DAYS_SINCE_SYNC, _HAS_GENERATED_TESTS)
+
+
+def _branch_metrics(row) -> dict:
+    """Metrics for one branch from a row selected with _METRIC_COLUMNS"""
+    return {
+        "commits_behind_base": row.commits_behind_base or 0,
+        "days_since_last_sync": row.days_since_last_sync,
+        "has_generated_tests": row.has_generated_tests,
+    }
+
+
+def _count(model, *criteria):
+    """Scalar subquery counting rows of a model matching the given criteria"""
+    return select(func.count()).select_from(model).where(*criteria).scalar_subquery()
+
+
+# Dependency to get database session; the session is scoped to the request's
+# task and released back to the registry once the response is sent
+async def get_db():
+    Session = get_scoped_session()
+    try:
+        yield Session()
+    finally:
+        await Session.remove()
 
 
 @app.on_event("startup")
@@ -113,126 +212,225 @@ def startup_event():
 
 
 @app.get("/")
-def root():
+async def root():
     return {"message": "Forge API", "version": "0.1.0"}
 
 
-@app.get("/repos", response_model=List[RepositoryResponse])
-def get_repos(db: Session = Depends(get_db)):
+@app.get("/repos")
+async def get_repos(db: AsyncSession = Depends(get_db)):
     """Get all tracked repositories"""
-    repos = db.query(Repository).all()
-    return repos
+    cached = _cached_response(("repos",))
+    if cached is not None:
+        return cached
+
+    rows = (await db.execute(select(*_columns(Repository, RepositoryResponse)))).all()
+    return _cache_response(("repos",), [dict(row._mapping) for row in rows])
 
 
-@app.post("/repos", response_model=RepositoryResponse)
-def add_repo(request: AddRepositoryRequest, db: Session = Depends(get_db)):
-    """Add a new repository to track"""
-    repo_path = Path(request.local_path)
-    if not repo_path.exists():
+@app.post(
+    "/repos",
+    response_model=RepositoryResponse,
+    response_class=PydanticResponse,
+    status_code=202,
+)
+async def add_repo(
+    request: AddRepositoryRequest,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+):
+    """Add a new repository to track; branches and commits are scanned in the background"""
+    # Canonicalize once so "/foo/", "/foo" and symlinks all map to the same
+    # row; the CLI stores resolved paths too (find_repo_root)
+    try:
+        repo_path = Path(request.local_path).resolve(strict=True)
+    except (FileNotFoundError, RuntimeError):
         raise HTTPException(status_code=400, detail="Repository path does not exist")
 
     # Check if already exists
-    existing = db.query(Repository).filter_by(local_path=str(repo_path)).first()
+    existing = await db.scalar(select(Repository.id).filter_by(local_path=str(repo_path)))
     if existing:
         raise HTTPException(status_code=400, detail="Repository already tracked")
 
-    # Scan and add repository
+    # Persist the repository row now (the scanner shells out to git and uses
+    # its own sync session, so keep it off the event loop) and scan after
+    # the response has been sent
     try:
-        repo = scan_repository(repo_path, db)
-        return repo
+        await asyncio.to_thread(register_repository, repo_path)
+        row = (await db.execute(
+            select(*_columns(Repository, RepositoryResponse)).filter_by(local_path=str(repo_path))
+        )).one()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    _response_cache.clear()
+    background_tasks.add_task(_scan_and_invalidate, repo_path)
+    return PydanticResponse(_pack(RepositoryResponse, row), status_code=202)
+
 
-@app.post("/repos/{repo_id}/scan")
-def scan_repo(repo_id: int, db: Session = Depends(get_db)):
-    """Manually scan a repository to update branches and commits"""
-    repo = db.query(Repository).filter_by(id=repo_id).first()
+@app.post("/repos/{repo_id}/scan", status_code=202)
+async def scan_repo(
+    repo_id: int,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+):
+    """Start a background scan of a repository to update branches and commits"""
+    repo = await db.get(Repository, repo_id)
     if not repo:
         raise HTTPException(status_code=404, detail="Repository not found")
 
-    try:
-        repo_path = Path(repo.local_path)
-        scan_repository(repo_path, db)
-        return {"message": "Repository scanned successfully"}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    background_tasks.add_task(_scan_and_invalidate, Path(repo.local_path))
+    return {"status": "scanning"}
+
+
+@app.get("/repos/{repo_id}/branches")
+async def get_repo_branches(
+    repo_id: int,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get a page of branches for a repository"""
+    key = ("branches", repo_id, limit, offset)
+    cached = _cached_response(key)
+    if cached is not None:
+        return cached
+
+    repo = await db.get(Repository, repo_id)
+    if not repo:
+        raise HTTPException(status_code=404, detail="Repository not found")
+
+    rows = (await db.execute(
+        select(*_columns(Branch, BranchResponse))
+        .where(Branch.repo_id == repo_id)
+        .order_by(Branch.id)
+        .limit(limit)
+        .offset(offset)
+    )).all()
+    return _cache_response(key, [dict(row._mapping) for row in rows])
 
 
-@app.get("/repos/{repo_id}/branches", response_model=List[BranchResponse])
-def get_repo_branches(repo_id: int, db: Session = Depends(get_db)):
-    """Get all branches for a repository"""
-    repo = db.query(Repository).filter_by(id=repo_id).first()
+@app.get("/repos/{repo_id}/branches-with-metrics")
+async def get_repo_branches_with_metrics(repo_id: int, db: AsyncSession = Depends(get_db)):
+    """Get all branches for a repository along with their test status in one query"""
+    repo = await db.get(Repository, repo_id)
     if not repo:
         raise HTTPException(status_code=404, detail="Repository not found")
 
-    branches = db.query(Branch).filter_by(repo_id=repo_id).all()
-    return branches
+    rows = (await db.execute(
+        select(*_columns(Branch, BranchResponse), _HAS_GENERATED_TESTS)
+        .where(Branch.repo_id == repo_id)
+    )).all()
+    return ORJSONResponse([dict(row._mapping) for row in rows])
+
+
+@app.get("/branches/{branch_id}/commits")
+async def get_branch_commits(
+    branch_id: int,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[datetime] = None,
+    cursor_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get a page of commits for a specific branch, newest first
+    
+    Pass the timestamp and id of the last commit received as ``cursor`` and
+    ``cursor_id`` to fetch the next page (keyset pagination over the
+    (branch_id, timestamp) index, with id breaking ties between commits made
+    in the same second).
+    """
+    branch = await db.get(Branch, branch_id)
+    if not branch:
+        raise HTTPException(status_code=404, detail="Branch not found")
+
+    query = select(*_columns(Commit, CommitResponse)).where(Commit.branch_id == branch_id)
+    if cursor is not None:
+        if cursor_id is not None:
+            query = query.where(tuple_(Commit.timestamp, Commit.id) < (cursor, cursor_id))
+        else:
+            query = query.where(Commit.timestamp < cursor)
+
+    rows = (await db.execute(
+        query.order_by(Commit.timestamp.desc(), Commit.id.desc()).limit(limit)
+    )).all()
+    return ORJSONResponse([dict(row._mapping) for row in rows])
 
 
-@app.get("/branches/{branch_id}/commits", response_model=List[CommitResponse])
-def get_branch_commits(branch_id: int, db: Session = Depends(get_db)):
-    """Get commits for a specific branch"""
-    branch = db.query(Branch).filter_by(id=branch_id).first()
+@app.get("/branches/{branch_id}/commits/stream")
+async def stream_branch_commits(branch_id: int, db: AsyncSession = Depends(get_db)):
+    """Stream a branch's full commit history, newest first, as NDJSON"""
+    branch = await db.get(Branch, branch_id)
     if not branch:
         raise HTTPException(status_code=404, detail="Branch not found")
 
-    commits = (
-        db.query(Commit)
-        .filter_by(branch_id=branch_id)
-        .order_by(Commit.timestamp.desc())
-        .all()
+    query = (
+        select(*_columns(Commit, CommitResponse))
+        .where(Commit.branch_id == branch_id)
+        .order_by(Commit.timestamp.desc(), Commit.id.desc())
+        .execution_options(yield_per=500)
     )
-    return commits
+    return StreamingResponse(_iter_ndjson(query), media_type="application/x-ndjson")
 
 
-@app.get("/branches/{branch_id}/metrics", response_model=BranchMetrics)
-def get_branch_metrics(branch_id: int, db: Session = Depends(get_db)):
+async def _iter_ndjson(query):
+    """Yield each result row of a query as one JSON line, 500 rows at a time"""
+    # The stream outlives the handler, so it reads through its own session
+    # rather than the request-scoped one
+    async with get_async_session() as session:
+        result = await session.stream(query)
+        async for row in result:
+            yield orjson.dumps(dict(row._mapping)) + b"\n"
+
+
+@app.get("/branches/{branch_id}/metrics", response_model=BranchMetrics, response_class=PydanticResponse)
+async def get_branch_metrics(branch_id: int, db: AsyncSession = Depends(get_db)):
     """Get metrics for a specific branch"""
-    branch = db.query(Branch).filter_by(id=branch_id).first()
+    branch = (await db.execute(
+        select(*_METRIC_COLUMNS).where(Branch.id == branch_id)
+    )).first()
     if not branch:
         raise HTTPException(status_code=404, detail="Branch not found")
 
-    # Commits behind base (simplified - count commits not in base branch)
-    commits_behind = 0  # TODO: Implement proper calculation
-
-    # Days since last sync
-    days_since_sync = None
-    if branch.last_synced_at:
-        delta = datetime.utcnow() - branch.last_synced_at
-        days_since_sync = delta.total_seconds() / 86400
-
-    # Has generated tests
-    has_tests = (
-        db.query(TestEvent)
-        .filter_by(branch_id=branch_id, status="success")
-        .first()
-        is not None
-    )
+    return PydanticResponse(BranchMetrics.model_construct(**_branch_metrics(branch)))
 
-    return BranchMetrics(
-        commits_behind_base=commits_behind,
-        days_since_last_sync=days_since_sync,
-        has_generated_tests=has_tests,
-    )
+
+@app.get("/repos/{repo_id}/branch-metrics")
+async def get_repo_branch_metrics(repo_id: int, db: AsyncSession = Depends(get_db)):
+    """Get metrics for every branch of a repository, keyed by branch id, in one query"""
+    repo = await db.get(Repository, repo_id)
+    if not repo:
+        raise HTTPException(status_code=404, detail="Repository not found")
+
+    rows = (await db.execute(
+        select(Branch.id, *_METRIC_COLUMNS).where(Branch.repo_id == repo_id)
+    )).all()
+    return ORJSONResponse({str(row.id): _branch_metrics(row) for row in rows})
 
 
-@app.get("/test-events", response_model=List[TestEventResponse])
-def get_test_events(
+_TEST_EVENTS_STMT = lambda_stmt(
+    lambda: select(*_columns(TestEvent, TestEventResponse))
+    .order_by(TestEvent.timestamp.desc())
+    .limit(100)
+)
+
+
+@app.get("/test-events")
+async def get_test_events(
     repo_id: Optional[int] = None,
     branch_id: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Get test generation events, optionally filtered by repo or branch"""
-    query = db.query(TestEvent)
-
+    # Lambda statements are compiled once per shape; the filter values are
+    # bound as parameters rather than baked into the cached SQL
+    query = _TEST_EVENTS_STMT
     if repo_id:
-        query = query.filter_by(repo_id=repo_id)
+        query += lambda s: s.where(TestEvent.repo_id == repo_id)
     if branch_id:
-        query = query.filter_by(branch_id=branch_id)
+        query += lambda s: s.where(TestEvent.branch_id == branch_id)
 
-    events = query.order_by(TestEvent.timestamp.desc()).limit(100).all()
-    return events
+    rows = (await db.execute(query)).all()
+    return ORJSONResponse([dict(row._mapping) for row in rows])
 
 
 class StatsResponse(BaseModel):
@@ -246,31 +444,25 @@ class StatsResponse(BaseModel):
     recent_activity: int  # Events in last 7 days
 
 
-@app.get("/stats", response_model=StatsResponse)
-def get_stats(db: Session = Depends(get_db)):
+@app.get("/stats", response_model=StatsResponse, response_class=PydanticResponse)
+async def get_stats(db: AsyncSession = Depends(get_db)):
     """Get overall statistics for the dashboard"""
     from datetime import datetime, timedelta
     
-    total_repos = db.query(Repository).count()
-    total_branches = db.query(Branch).count()
-    total_commits = db.query(Commit).count()
-    total_test_events = db.query(TestEvent).count()
-    
-    successful_tests = db.query(TestEvent).filter_by(status="success").count()
-    failed_tests = db.query(TestEvent).filter_by(status="failure").count()
-    active_branches = db.query(Branch).filter_by(status="active").count()
-    
     # Recent activity (last 7 days)
     seven_days_ago = datetime.utcnow() - timedelta(days=7)
-    recent_activity = db.query(TestEvent).filter(TestEvent.timestamp >= seven_days_ago).count()
     
-    return StatsResponse(
-        total_repos=total_repos,
-        total_branches=total_branches,
-        total_commits=total_commits,
-        total_test_events=total_test_events,
-        successful_tests=successful_tests,
-        failed_tests=failed_tests,
-        active_branches=active_branches,
-        recent_activity=recent_activity,
-    )
+    # Every count is a scalar subquery of one SELECT: a single round-trip
+    row = (await db.execute(select(
+        _count(Repository).label("total_repos"),
+        _count(Branch).label("total_branches"),
+        _count(Commit).label("total_commits"),
+        _count(TestEvent).label("total_test_events"),
+        _count(TestEvent, TestEvent.status == "success").label("successful_tests"),
+        _count(TestEvent, TestEvent.status == "failure").label("failed_tests"),
+        _count(Branch, Branch.status == "active").label("active_branches"),
+        _count(TestEvent, TestEvent.timestamp >= seven_days_ago).label("recent_activity"),
+    ))).one()
+    
+    stats = _pack(StatsResponse, row)
+    return PydanticResponse(stats)
@@ -1,58 +1,193 @@
 """CLI interface for Forge"""
 
 import os
+import re
 import sys
 import subprocess
-import signal
-import time
-import webbrowser
-import threading
-import shutil
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-
-from forge.core import (
-    ForgeConfig,
-    find_repo_root,
-    load_config,
-    save_config,
-    detect_language,
-    get_config_path,
-    load_env_file,
-    is_git_repo,
-    get_current_branch,
-    sync_branch,
-    stage_files,
-    commit_changes,
-    push_branch,
-    is_clean_working_tree,
-    run_git_command,
-    create_branch,
-    branch_exists,
-    switch_branch,
-    list_branches,
-    detect_main_branch,
-    branch_exists_local,
-    get_changed_source_files,
-)
-from forge.services import TestService
-from forge.adapters.python.pytest_adapter import PythonPytestAdapter
-from forge.utils.validation import (
-    assert_git_repo,
-    assert_no_rebase,
-    assert_clean_working_tree,
-    normalize_branch_name,
-    validate_branch_name,
-)
-from forge.metadata.branches import register_branch
-from forge.database.tracker import track_test_event, ensure_repo_tracked
+
+# Opening fence line (with optional language), body, closing fence
+_FENCED_BLOCK_RE = re.compile(r"```[^\n]*\n(.*?)\s*```", re.DOTALL)
+
+# Default upper bound on concurrent AI requests when generating tests
+# (overridden by max_parallel in .fg.yml, then the FORGE_PARALLEL env var)
+_MAX_CONCURRENT_GENERATIONS = 5
+
+# Source files larger than this would not fit in a model's context window
+# (roughly 250k tokens), so they are rejected before being read or sent
+_MAX_SOURCE_BYTES = 1_000_000
 
 app = typer.Typer(help="Forge - Opinionated Git workflows with AI-generated tests")
 console = Console()
 
+# Command functions by CLI name, in help order. They are registered with the
+# Typer app by register_commands(); main() registers only the command
+# actually invoked.
+_COMMANDS = {}
+_REGISTERED = set()
+
+
+def _command(name: str):
+    """Record a CLI command without registering it with Typer yet"""
+    def decorator(func):
+        _COMMANDS[name] = func
+        return func
+    return decorator
+
+
+@app.callback()
+def _callback():
+    # Keeps Typer in multi-command mode when a single command is registered
+    pass
+
+
+class _PlainProgress:
+    """Stand-in for rich's Progress that prints the task description once"""
+    
+    def __enter__(self) -> "_PlainProgress":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        pass
+    
+    def add_task(self, description: str, total: Optional[float] = None) -> int:
+        console.print(description)
+        return 0
+    
+    def advance(self, task: int, advance: float = 1) -> None:
+        pass
+
+
+def _get_config(repo_root: Path):
+    """Load the repository's Forge config, exiting with an error if it is missing or invalid"""
+    from pydantic import ValidationError
+    from rich.markup import escape
+    from forge.core import load_config
+    
+    # load_config caches the parsed file per mtime, so commands sharing a
+    # process share one parse
+    try:
+        return load_config(repo_root)
+    except FileNotFoundError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+    except ValidationError as e:
+        console.print(f"[red]Error: Invalid .fg.yml: {escape(str(e))}[/red]")
+        raise typer.Exit(1)
+
+
+@lru_cache(maxsize=4)
+def _get_adapter(language: str):
+    """Get the shared adapter for a language, exiting with an error if unsupported"""
+    if language == "python":
+        from forge.adapters.python.pytest_adapter import PythonPytestAdapter
+        
+        return PythonPytestAdapter()
+    
+    console.print(f"[red]Error: Language {language} not supported yet[/red]")
+    raise typer.Exit(1)
+
+
+def _list_files(root: Path) -> set[str]:
+    """Paths of all files under root (as strings), from one os.scandir walk"""
+    files = set()
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        files.add(entry.path)
+        except OSError:
+            continue
+    return files
+
+
+def _env_max_parallel() -> int:
+    """Concurrent AI request limit from FORGE_PARALLEL, or the default"""
+    try:
+        value = int(os.environ.get("FORGE_PARALLEL", ""))
+    except ValueError:
+        return _MAX_CONCURRENT_GENERATIONS
+    return max(value, 1)
+
+
+def _read_utf8(path: Path, max_bytes: Optional[int] = None) -> str:
+    """
+    Read a UTF-8 text file in one unbuffered read
+    
+    Line endings are normalized to "\n" as in text mode. Raises ValueError,
+    without reading, if the file exceeds max_bytes.
+    """
+    with open(path, "rb", buffering=0) as f:
+        if max_bytes is not None:
+            size = os.fstat(f.fileno()).st_size
+            if size > max_bytes:
+                raise ValueError(f"file is too large to send to the AI provider ({size} bytes, limit {max_bytes})")
+        text = f.read().decode("utf-8")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _write_utf8(path: Path, text: str, created_dirs: set) -> None:
+    """
+    Write a UTF-8 text file, creating its directory on first use
+    
+    created_dirs records directories already made during this run so each
+    one costs a single mkdir no matter how many files land in it.
+    """
+    if path.parent not in created_dirs:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        created_dirs.add(path.parent)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def _precompile(path: Path) -> None:
+    """Byte-compile a module into its __pycache__, ignoring any errors"""
+    import py_compile
+    
+    py_compile.compile(str(path), doraise=False, quiet=2)
+
+
+def _track_repo_in_background(repo_root: Path):
+    """
+    Register the repo for tracking on a background thread
+    
+    The scan overlaps with progress or pytest output, so its warnings are
+    collected rather than printed. Call the returned function to wait for
+    the thread and print them.
+    """
+    import logging
+    import threading
+    from rich.markup import escape
+    from forge.database.tracker import ensure_repo_tracked
+    
+    messages = []
+    
+    class _Collect(logging.Handler):
+        def emit(self, record: logging.LogRecord) -> None:
+            messages.append(record.getMessage())
+    
+    handler = _Collect()
+    logger = logging.getLogger("forge.database")
+    logger.addHandler(handler)
+    thread = threading.Thread(target=ensure_repo_tracked, args=(repo_root,), daemon=True)
+    thread.start()
+    
+    def finish() -> None:
+        thread.join()
+        logger.removeHandler(handler)
+        for message in messages:
+            console.print(f"[yellow]Warning: {escape(message)}[/yellow]")
+    
+    return finish
+
 
 def merge_tests(existing_test_code: str, new_test_code: str) -> str:
     """
@@ -77,57 +212,172 @@ def merge_tests(existing_test_code: str, new_test_code: str) -> str:
     if not new:
         return existing
     
-    # Check if there's a trailing newline in existing code
-    if not existing.endswith('\n'):
-        existing += '\n\n'
-    else:
-        existing = existing.rstrip() + '\n\n'
-    
-    return existing + new
+    # Both parts are already stripped, so one join builds the result
+    return "\n\n".join((existing, new))
 
 
 def strip_markdown_code_fences(code: str) -> str:
     """Remove markdown code fences (```python, ```py, ```) from the start and end of code"""
     code = code.strip()
     
-    # Remove opening code fence (e.g., ```python, ```py, ```)
-    # Look for ``` followed by optional language identifier and newline
+    # Common case: one fenced block; a single anchored regex match
+    match = _FENCED_BLOCK_RE.fullmatch(code)
+    if match:
+        return match.group(1)
+    
+    # Only an opening fence (truncated output) or only a closing fence
     if code.startswith("```"):
-        # Find the first newline after the opening fence
-        first_newline = code.find("\n")
-        if first_newline != -1:
-            # Remove everything up to and including the newline
-            code = code[first_newline + 1:]
-        else:
-            # No newline found, check if it's just ``` at the end or whole string is ```
-            if code == "```":
-                return ""
-            # Try to remove just the fence (might be ```something without newline)
-            code = code[3:].strip()
-    
-    # Remove closing code fence (```)
-    # Look for ``` at the end, possibly with whitespace before it
-    code = code.rstrip()
+        code = code.partition("\n")[2]
     if code.endswith("```"):
-        # Find the last newline before the closing fence
-        last_newline = code.rfind("\n")
-        if last_newline != -1:
-            # Remove from the newline to the end
-            code = code[:last_newline].rstrip()
-        else:
-            # No newline, just remove the fence (shouldn't happen normally)
-            code = code[:-3].strip()
+        code = code[:-3]
+    
+    return code.rstrip()
+
+
+def _generate_tests(
+    repo_root: Path,
+    test_service,
+    files: list[str],
+    test_paths: dict,
+    existing_test_files: set,
+    update: bool = False,
+    max_parallel: Optional[int] = None,
+    progress=None,
+    created_dirs: Optional[set] = None,
+) -> tuple[list[str], list[str], list[str]]:
+    """
+    Generate tests for source files concurrently (shared by create-tests and submit)
+    
+    Args:
+        repo_root: Repository root
+        test_service: TestService used for AI generation
+        files: Source files, relative to repo_root, to generate tests for
+        test_paths: Test file path for each source file
+        existing_test_files: Paths (as strings) of test files that already exist
+        update: Merge tests for untested functions into existing test files
+        max_parallel: Maximum concurrent AI requests (default FORGE_PARALLEL, else 5)
+        progress: rich Progress, or a stand-in, counting completed files
+        created_dirs: Directories known to exist already (e.g. test_dir);
+            any others are created once, on the first write into them
+    
+    Returns:
+        (generated, updated, failed): new test files, rewritten or merged
+        test files, and source files whose generation failed
+    """
+    import asyncio
+    
+    if not files:
+        return [], [], []
+    if progress is None:
+        progress = _PlainProgress()
+    
+    generated_tests = []
+    updated_tests = []
+    failed_files = []
+    created_dirs = set(created_dirs or ())
+    
+    async def generate_for_file(file_path: str, progress, semaphore: asyncio.Semaphore):
+        async with semaphore:
+            try:
+                # Read source file off the event loop so disk reads overlap
+                # with AI requests already in flight
+                try:
+                    code = await asyncio.to_thread(_read_utf8, repo_root / file_path, _MAX_SOURCE_BYTES)
+                except FileNotFoundError:
+                    console.print(f"[yellow]Warning: {file_path} does not exist, skipping[/yellow]")
+                    return
+                
+                test_file_path = test_paths[file_path]
+                
+                # Check if test file exists for incremental updates; the
+                # directory listing answers that without a stat, and the
+                # file is read at most once
+                existing_test_code = None
+                test_existed = str(test_file_path) in existing_test_files
+                if test_existed and update:
+                    try:
+                        existing_test_code = await asyncio.to_thread(_read_utf8, test_file_path)
+                    except FileNotFoundError:
+                        # Removed since the listing; generate it from scratch
+                        test_existed = False
+                
+                # Generate tests (incremental if updating existing tests)
+                test_code = await test_service.agenerate_tests_for_file(
+                    file_path,
+                    code,
+                    test_file_path,
+                    existing_test_code=existing_test_code,
+                    incremental=(update and test_existed),
+                )
+                
+                # Strip markdown code fences if present
+                test_code = strip_markdown_code_fences(test_code)
+                
+                # Handle writing test file based on update mode
+                if update and test_existed:
+                    if test_code:
+                        # Merge new tests with existing tests
+                        merged_test_code = merge_tests(existing_test_code, test_code)
+                        await asyncio.to_thread(_write_utf8, test_file_path, merged_test_code, created_dirs)
+                        updated_tests.append(str(test_file_path))
+                    else:
+                        # No new tests generated (all functions already tested)
+                        return
+                elif test_code:
+                    # New test file or full regeneration (when update=False or test doesn't exist)
+                    await asyncio.to_thread(_write_utf8, test_file_path, test_code, created_dirs)
+                    if test_existed:
+                        updated_tests.append(str(test_file_path))
+                    else:
+                        generated_tests.append(str(test_file_path))
+                else:
+                    # No test code generated and not updating existing - should not happen
+                    console.print(f"[yellow]Warning: No test code generated for {file_path}[/yellow]")
+                    return
+                
+                # Warm the .pyc of the module under test for the next pytest
+                # run. Test modules themselves are skipped: pytest rewrites
+                # their asserts into its own cache and ignores a plain .pyc
+                if not sys.dont_write_bytecode:
+                    await asyncio.to_thread(_precompile, repo_root / file_path)
+                
+            except Exception as e:
+                console.print(f"[red]Error generating tests for {file_path}: {e}[/red]")
+                failed_files.append(file_path)
+            finally:
+                progress.advance(overall)
+    
+    async def generate_all(progress):
+        # The semaphore caps AI requests in flight
+        semaphore = asyncio.Semaphore(max_parallel or _env_max_parallel())
+        await asyncio.gather(
+            *(generate_for_file(file_path, progress, semaphore) for file_path in files)
+        )
     
-    return code
+    # One counter task for the whole run; per-file tasks would re-render
+    # the display on every add, update and remove
+    overall = progress.add_task(f"Generating tests for {len(files)} file(s)...", total=len(files))
+    
+    asyncio.run(generate_all(progress))
+    return generated_tests, updated_tests, failed_files
 
 
-@app.command()
+@_command("init")
 def init(
     base_branch: Optional[str] = typer.Option(None, help="Base branch name (auto-detected if not specified)"),
     language: Optional[str] = typer.Option(None, help="Project language (auto-detected if not specified)"),
     test_dir: str = typer.Option("tests/", help="Directory for test files"),
 ):
     """Initialize Forge in the current Git repository"""
+    from forge.core import (
+        ForgeConfig,
+        find_repo_root,
+        save_config,
+        detect_language,
+        get_config_path,
+        detect_main_branch,
+    )
+    
     repo_root = find_repo_root()
     
     if repo_root is None:
@@ -184,13 +434,30 @@ def init(
     console.print(f"  Test directory: {test_dir}")
 
 
-@app.command()
+@_command("branch")
 def branch(
     branch_name: Optional[str] = typer.Argument(None, help="Name of the branch to create (omit to list branches)"),
     base: Optional[str] = typer.Option(None, help="Base branch (default: main if on main, otherwise current branch)"),
     require_clean: bool = typer.Option(True, help="Require clean working tree"),
 ):
     """Create a new Forge-managed branch, or list all branches if no name is provided"""
+    from forge.core import (
+        find_repo_root,
+        get_current_branch,
+        create_branch,
+        branch_exists,
+        list_branches,
+        detect_main_branch,
+    )
+    from forge.utils.validation import (
+        assert_git_repo,
+        assert_no_rebase,
+        assert_clean_working_tree,
+        normalize_branch_name,
+        validate_branch_name,
+    )
+    from forge.metadata.branches import register_branch
+    
     repo_root = find_repo_root()
     
     if repo_root is None:
@@ -295,11 +562,13 @@ def branch(
         raise typer.Exit(1)
 
 
-@app.command()
+@_command("switch")
 def switch(
     branch_name: str = typer.Argument(..., help="Name of the branch to switch to"),
 ):
     """Switch to an existing branch"""
+    from forge.core import find_repo_root, switch_branch
+    
     repo_root = find_repo_root()
     
     if repo_root is None:
@@ -317,22 +586,26 @@ def switch(
         raise typer.Exit(1)
 
 
-@app.command()
+@_command("sync")
 def sync():
     """Rebase current branch onto base branch"""
-    repo_root = find_repo_root()
+    from forge.core import get_repo_status, sync_branch
     
-    if repo_root is None:
+    # One rev-parse answers "in a repo?", "which branch?" and "where is the root?"
+    status = get_repo_status()
+    repo_root = status.toplevel
+    
+    if not status.is_repo or repo_root is None:
         console.print("[red]Error: Not in a Git repository[/red]")
         raise typer.Exit(1)
     
-    try:
-        config = load_config(repo_root)
-    except FileNotFoundError as e:
-        console.print(f"[red]Error: {e}[/red]")
+    if status.current_branch is None:
+        console.print("[red]Error: Current branch has no commits yet[/red]")
         raise typer.Exit(1)
     
-    current_branch = get_current_branch(repo_root)
+    config = _get_config(repo_root)
+    
+    current_branch = status.current_branch
     
     if current_branch == config.base_branch:
         console.print(
@@ -344,14 +617,14 @@ def sync():
     console.print(f"[cyan]Syncing {current_branch} onto {config.base_branch}...[/cyan]")
     
     try:
-        sync_branch(config.base_branch, repo_root)
+        sync_branch(config.base_branch, repo_root, current_branch)
         console.print("[green]✓ Branch synced successfully![/green]")
     except RuntimeError as e:
         console.print(f"[red]Error: {e}[/red]")
         raise typer.Exit(1)
 
 
-@app.command()
+@_command("create-tests")
 def create_tests(
     provider: Optional[str] = typer.Option(None, help="AI provider (openai, anthropic, etc.)"),
     model: Optional[str] = typer.Option(None, help="AI model name"),
@@ -361,6 +634,10 @@ def create_tests(
     update: bool = typer.Option(False, help="Update existing test files"),
 ):
     """Generate tests for source files that don't have tests yet"""
+    from forge.core import find_repo_root, load_env_file, get_current_branch
+    from forge.services import TestService
+    from forge.database.tracker import track_test_event
+    
     repo_root = find_repo_root()
     
     if repo_root is None:
@@ -370,18 +647,10 @@ def create_tests(
     # Load .env file before loading config
     load_env_file(repo_root)
     
-    try:
-        config = load_config(repo_root)
-    except FileNotFoundError as e:
-        console.print(f"[red]Error: {e}[/red]")
-        raise typer.Exit(1)
+    config = _get_config(repo_root)
     
     # Get adapter for language
-    if config.language == "python":
-        adapter = PythonPytestAdapter()
-    else:
-        console.print(f"[red]Error: Language {config.language} not supported yet[/red]")
-        raise typer.Exit(1)
+    adapter = _get_adapter(config.language)
     
     # Get source files that need tests
     console.print("[cyan]Finding source files that need tests...[/cyan]")
@@ -405,15 +674,20 @@ def create_tests(
     test_dir = repo_root / config.test_dir
     test_dir.mkdir(parents=True, exist_ok=True)
     
-    files_to_test = []
-    for source_file in all_source_files:
-        test_file_path = adapter.get_test_file_path(source_file, test_dir)
-        
-        # Skip if test exists and --update is not set
-        if test_file_path.exists() and not update:
-            continue
-        
-        files_to_test.append(source_file)
+    # Map each source file to its test file once, and learn which test files
+    # exist from a single listing of test_dir rather than a stat per file
+    test_paths = {
+        source_file: adapter.get_test_file_path(source_file, test_dir)
+        for source_file in all_source_files
+    }
+    existing_test_files = _list_files(test_dir)
+    
+    # Skip files whose test exists unless --update is set
+    files_to_test = [
+        source_file
+        for source_file, test_file_path in test_paths.items()
+        if update or str(test_file_path) not in existing_test_files
+    ]
     
     if not files_to_test:
         if update:
@@ -446,85 +720,39 @@ def create_tests(
         console.print(f"[red]Error: {e}[/red]")
         raise typer.Exit(1)
     
-    # Generate tests
-    generated_tests = []
-    updated_tests = []
-    failed_files = []
+    if len(files_to_test) == 1 or not console.is_terminal or os.environ.get("CI"):
+        # A single file, redirected output or CI gets static status lines; a
+        # live display (and its refresh thread) buys nothing there
+        progress = _PlainProgress()
+    else:
+        from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
+        
+        progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=console,
+            refresh_per_second=4,
+            transient=True,
+        )
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        for file_path in files_to_test:
-            task = progress.add_task(f"Generating tests for {file_path}...", total=None)
-            
-            try:
-                # Read source file
-                source_path = repo_root / file_path
-                if not source_path.exists():
-                    console.print(f"[yellow]Warning: {file_path} does not exist, skipping[/yellow]")
-                    progress.remove_task(task)
-                    continue
-                
-                code = source_path.read_text()
-                
-                # Get test file path
-                test_file_path = adapter.get_test_file_path(file_path, test_dir)
-                
-                # Check if test file exists for incremental updates
-                existing_test_code = None
-                test_existed = test_file_path.exists()
-                if test_existed and update:
-                    existing_test_code = test_file_path.read_text()
-                
-                # Generate tests (incremental if updating existing tests)
-                test_code = test_service.generate_tests_for_file(
-                    file_path,
-                    code,
-                    test_file_path,
-                    existing_test_code=existing_test_code,
-                    incremental=(update and test_existed),
-                )
-                
-                # Strip markdown code fences if present
-                test_code = strip_markdown_code_fences(test_code)
-                
-                # Handle writing test file based on update mode
-                if update and test_existed:
-                    if test_code:
-                        # Merge new tests with existing tests
-                        merged_test_code = merge_tests(existing_test_code, test_code)
-                        test_file_path.write_text(merged_test_code)
-                        updated_tests.append(str(test_file_path))
-                        progress.update(task, description=f"✓ Updated tests for {file_path}")
-                    else:
-                        # No new tests generated (all functions already tested)
-                        progress.update(task, description=f"✓ No new tests needed for {file_path}")
-                        progress.remove_task(task)
-                        continue
-                elif test_code:
-                    # New test file or full regeneration (when update=False or test doesn't exist)
-                    test_file_path.parent.mkdir(parents=True, exist_ok=True)
-                    test_file_path.write_text(test_code)
-                    if test_existed:
-                        updated_tests.append(str(test_file_path))
-                        progress.update(task, description=f"✓ Updated tests for {file_path}")
-                    else:
-                        generated_tests.append(str(test_file_path))
-                        progress.update(task, description=f"✓ Generated tests for {file_path}")
-                else:
-                    # No test code generated and not updating existing - should not happen
-                    console.print(f"[yellow]Warning: No test code generated for {file_path}[/yellow]")
-                    progress.remove_task(task)
-                    continue
-                
-                progress.remove_task(task)
-                
-            except Exception as e:
-                console.print(f"[red]Error generating tests for {file_path}: {e}[/red]")
-                failed_files.append(file_path)
-                progress.remove_task(task)
+    # Register the repo for tracking while the AI requests are in flight
+    finish_tracking = _track_repo_in_background(repo_root)
+    
+    # Generate tests concurrently
+    with progress:
+        generated_tests, updated_tests, failed_files = _generate_tests(
+            repo_root,
+            test_service,
+            files_to_test,
+            test_paths,
+            existing_test_files,
+            update=update,
+            max_parallel=config.max_parallel,
+            progress=progress,
+            created_dirs={test_dir},
+        )
     
     if failed_files:
         console.print(f"[red]Failed to generate tests for {len(failed_files)} file(s)[/red]")
@@ -540,8 +768,8 @@ def create_tests(
         console.print(f"[green]✓ Updated {len(updated_tests)} existing test file(s)[/green]")
     
     # Track test generation event
+    finish_tracking()
     try:
-        ensure_repo_tracked(repo_root)
         current_branch = get_current_branch(repo_root)
         track_test_event(
             command_used="create-tests",
@@ -555,27 +783,21 @@ def create_tests(
         pass  # Don't fail if tracking fails
 
 
-@app.command()
+@_command("test")
 def test():
     """Run existing tests"""
+    from forge.core import find_repo_root
+    
     repo_root = find_repo_root()
     
     if repo_root is None:
         console.print("[red]Error: Not in a Git repository[/red]")
         raise typer.Exit(1)
     
-    try:
-        config = load_config(repo_root)
-    except FileNotFoundError as e:
-        console.print(f"[red]Error: {e}[/red]")
-        raise typer.Exit(1)
+    config = _get_config(repo_root)
     
     # Get adapter for language
-    if config.language == "python":
-        adapter = PythonPytestAdapter()
-    else:
-        console.print(f"[red]Error: Language {config.language} not supported yet[/red]")
-        raise typer.Exit(1)
+    adapter = _get_adapter(config.language)
     
     # Run tests from tests/src/ directory
     test_dir = repo_root / config.test_dir
@@ -597,7 +819,7 @@ def test():
         raise typer.Exit(1)
 
 
-@app.command()
+@_command("submit")
 def submit(
     provider: Optional[str] = typer.Option(None, help="AI provider (openai, anthropic, etc.)"),
     model: Optional[str] = typer.Option(None, help="AI model name"),
@@ -607,28 +829,40 @@ def submit(
     skip_tests: bool = typer.Option(False, help="Skip test generation and validation"),
 ):
     """Sync, test, commit, and push branch"""
-    repo_root = find_repo_root()
+    from forge.core import (
+        get_repo_status,
+        load_env_file,
+        sync_branch,
+        commit_all_changes,
+        push_branch,
+    )
+    from forge.services import TestService
+    from forge.database.tracker import track_test_event, ensure_repo_tracked
     
-    if repo_root is None:
+    # One rev-parse answers "in a repo?", "which branch?" and "where is the root?"
+    status = get_repo_status()
+    repo_root = status.toplevel
+    
+    if not status.is_repo or repo_root is None:
         console.print("[red]Error: Not in a Git repository[/red]")
         raise typer.Exit(1)
     
+    if status.current_branch is None:
+        console.print("[red]Error: Current branch has no commits yet[/red]")
+        raise typer.Exit(1)
+    
     # Load .env file before loading config
     load_env_file(repo_root)
     
-    try:
-        config = load_config(repo_root)
-    except FileNotFoundError as e:
-        console.print(f"[red]Error: {e}[/red]")
-        raise typer.Exit(1)
+    config = _get_config(repo_root)
     
-    current_branch = get_current_branch(repo_root)
+    current_branch = status.current_branch
     
     if current_branch == config.base_branch:
         console.print(
-            f"[red]Error: Cannot submit {config.base_branch} branch[/red]"
+            f"[red]Error: Cannot submit {config.base_branch} branch[/red]\n"
+            "Switch to a feature branch first."
         )
-        console.print("Switch to a feature branch first.")
         raise typer.Exit(1)
     
     console.print(f"[cyan]Submitting branch: {current_branch}[/cyan]")
@@ -636,7 +870,7 @@ def submit(
     # Step 1: Sync
     console.print("\n[bold]Step 1: Syncing branch...[/bold]")
     try:
-        sync_branch(config.base_branch, repo_root)
+        sync_branch(config.base_branch, repo_root, current_branch)
         console.print("[green]✓ Branch synced[/green]")
     except RuntimeError as e:
         console.print(f"[red]Error: {e}[/red]")
@@ -649,11 +883,7 @@ def submit(
         console.print("\n[bold]Step 2: Creating and running tests...[/bold]")
         try:
             # Create tests
-            if config.language == "python":
-                adapter = PythonPytestAdapter()
-            else:
-                console.print(f"[red]Error: Language {config.language} not supported yet[/red]")
-                raise typer.Exit(1)
+            adapter = _get_adapter(config.language)
             
             changed_files = adapter.get_changed_files(repo_root, config.base_branch)
             
@@ -668,42 +898,47 @@ def submit(
                 )
                 
                 # Display AI provider info
-                console.print(f"[cyan]Using AI provider: {test_service.config.provider}[/cyan]")
-                console.print(f"[cyan]Using model: {test_service.config.model}[/cyan]")
+                console.print(
+                    f"[cyan]Using AI provider: {test_service.config.provider}[/cyan]\n"
+                    f"[cyan]Using model: {test_service.config.model}[/cyan]"
+                )
                 
                 test_dir = repo_root / config.test_dir
                 test_dir.mkdir(parents=True, exist_ok=True)
                 
-                generated_tests = []
-                for file_path in changed_files:
-                    source_path = repo_root / file_path
-                    if not source_path.exists():
-                        continue
-                    
-                    test_file_path = adapter.get_test_file_path(file_path, test_dir)
-                    if test_file_path.exists():
-                        continue
-                    
-                    code = source_path.read_text()
-                    test_code = test_service.generate_tests_for_file(
-                        file_path, code, test_file_path
-                    )
-                    # Strip markdown code fences if present
-                    test_code = strip_markdown_code_fences(test_code)
-                    test_file_path.parent.mkdir(parents=True, exist_ok=True)
-                    test_file_path.write_text(test_code)
-                    generated_tests.append(str(test_file_path))
+                # Resolve all test paths up front; directories are created only
+                # when a test file is actually written into them
+                source_files = [f for f in changed_files if (repo_root / f).exists()]
+                test_paths = {f: adapter.get_test_file_path(f, test_dir) for f in source_files}
+                existing_test_files = _list_files(test_dir)
+                pending = [f for f in source_files if str(test_paths[f]) not in existing_test_files]
+                
+                # Same concurrent generation path as create-tests; files that
+                # already have tests are left alone
+                generated_tests, _, failed_files = _generate_tests(
+                    repo_root,
+                    test_service,
+                    pending,
+                    test_paths,
+                    existing_test_files,
+                    max_parallel=config.max_parallel,
+                    created_dirs={test_dir},
+                )
+                if failed_files:
+                    raise RuntimeError(f"Failed to generate tests for {len(failed_files)} file(s)")
                 
                 if generated_tests:
                     console.print(f"[green]✓ Generated {len(generated_tests)} test file(s)[/green]")
                 
-                # Run tests
-                success = adapter.run_tests(repo_root, test_dir)
+                # Run tests, registering the repo for tracking while pytest runs
+                test_run = adapter.start_tests(repo_root, test_dir)
+                finish_tracking = _track_repo_in_background(repo_root)
+                success = adapter.wait_tests(test_run)
+                finish_tracking()
                 if not success:
                     console.print("[red]✗ Tests failed. Aborting submission.[/red]")
-                    # Track failure
+                    # Track failure (the repo was registered while pytest ran)
                     try:
-                        ensure_repo_tracked(repo_root)
                         track_test_event(
                             command_used="submit",
                             status="failure",
@@ -727,15 +962,16 @@ def submit(
     # Step 3: Stage and commit
     console.print("\n[bold]Step 3: Staging and committing changes...[/bold]")
     
-    if not is_clean_working_tree(repo_root):
-        # Stage all changes including generated tests
-        try:
-            stage_files(["."], repo_root)
-            commit_changes("fg: add generated tests", repo_root)
-            console.print("[green]✓ Changes committed[/green]")
-        except RuntimeError as e:
-            console.print(f"[red]Error: {e}[/red]")
-            raise typer.Exit(1)
+    # Stage all changes including generated tests and commit them; a clean
+    # tree shows up as "nothing to commit" rather than a separate status call
+    try:
+        committed = commit_all_changes("fg: add generated tests", repo_root)
+    except RuntimeError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+    
+    if committed:
+        console.print("[green]✓ Changes committed[/green]")
     else:
         console.print("[yellow]No changes to commit[/yellow]")
     
@@ -748,8 +984,11 @@ def submit(
         console.print(f"[red]Error: {e}[/red]")
         raise typer.Exit(1)
     
-    console.print(f"\n[bold green]✓ Submission complete![/bold green]")
-    console.print(f"Branch {current_branch} is ready for review.")
+    # Consecutive lines go out as one render and one write
+    console.print(
+        "\n[bold green]✓ Submission complete![/bold green]\n"
+        f"Branch {current_branch} is ready for review."
+    )
     
     # Track successful submission
     try:
@@ -775,15 +1014,17 @@ def find_forge_project_root() -> Path:
     """Find the Forge project root (where forge/cli.py is)"""
     # Method 1: Check if we're already in the Forge project
     # __file__ is forge/cli.py, so parent.parent is project root
+    # (this file is forge/cli.py, so only pyproject.toml needs checking)
     current_file = Path(__file__).resolve()
     forge_project = current_file.parent.parent
-    if (forge_project / "forge" / "cli.py").exists() and (forge_project / "pyproject.toml").exists():
+    if current_file.parent.name == "forge" and (forge_project / "pyproject.toml").exists():
         return forge_project
     
     # Method 2: Look for forge/cli.py in current directory or parents
+    # (pyproject.toml first: most directories lack it, so one stat per level)
     search_path = Path.cwd()
     while search_path != search_path.parent:
-        if (search_path / "forge" / "cli.py").exists() and (search_path / "pyproject.toml").exists():
+        if (search_path / "pyproject.toml").exists() and (search_path / "forge" / "cli.py").exists():
             return search_path
         search_path = search_path.parent
     
@@ -899,7 +1140,7 @@ def install_forge(python_exe: Path, project_root: Path) -> None:
         console.print("[yellow]Continuing anyway...[/yellow]")
 
 
-@app.command()
+@_command("run")
 def run(
     port: int = typer.Option(8000, help="Backend port"),
     frontend_port: int = typer.Option(5173, help="Frontend dev server port"),
@@ -907,6 +1148,11 @@ def run(
     skip_setup: bool = typer.Option(False, help="Skip dependency installation"),
 ):
     """Start Forge dashboard (backend + frontend) - All-in-one setup and run"""
+    import shutil
+    import signal
+    import threading
+    import time
+    import webbrowser
     
     # Find Forge project root (not user's repo)
     forge_root = find_forge_project_root()
@@ -1060,6 +1306,37 @@ def run(
         raise typer.Exit(1)
 
 
-if __name__ == "__main__":
+def register_commands(names: Optional[list[str]] = None) -> typer.Typer:
+    """
+    Register CLI commands with the Typer app and return it
+    
+    Code that drives ``app`` directly (e.g. typer.testing.CliRunner) calls
+    this first; registering a command twice is a no-op.
+    
+    Args:
+        names: Commands to register (default: all of them)
+    
+    Returns:
+        The Typer app
+    """
+    for name in names if names is not None else list(_COMMANDS):
+        if name not in _REGISTERED:
+            app.command(name=name)(_COMMANDS[name])
+            _REGISTERED.add(name)
+    return app
+
+
+def main():
+    """CLI entry point: register the invoked command (or all of them) and run"""
+    name = sys.argv[1] if len(sys.argv) > 1 else None
+    if name in _COMMANDS:
+        register_commands([name])
+    else:
+        # Top-level --help, completion options or an unknown command
+        register_commands()
     app()
 
+
+if __name__ == "__main__":
+    main()
+
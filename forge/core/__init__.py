@@ -1,54 +1,45 @@
 """Core Forge functionality"""
 
-from forge.core.config import (
-    ForgeConfig,
-    find_repo_root,
-    load_config,
-    save_config,
-    detect_language,
-    get_config_path,
-    load_env_file,
-)
-from forge.core.git_ops import (
-    is_git_repo,
-    get_current_branch,
-    sync_branch,
-    stage_files,
-    commit_changes,
-    push_branch,
-    is_clean_working_tree,
-    run_git_command,
-    create_branch,
-    branch_exists,
-    switch_branch,
-    list_branches,
-    detect_main_branch,
-    branch_exists_local,
-)
-from forge.core.diff import get_changed_source_files
+import importlib
 
-__all__ = [
-    "ForgeConfig",
-    "find_repo_root",
-    "load_config",
-    "save_config",
-    "detect_language",
-    "get_config_path",
-    "load_env_file",
-    "is_git_repo",
-    "get_current_branch",
-    "sync_branch",
-    "stage_files",
-    "commit_changes",
-    "push_branch",
-    "is_clean_working_tree",
-    "run_git_command",
-    "create_branch",
-    "branch_exists",
-    "switch_branch",
-    "list_branches",
-    "detect_main_branch",
-    "branch_exists_local",
-    "get_changed_source_files",
-]
+# Public names and the submodule defining each. Submodules are imported on
+# first attribute access, so importing forge.core.git_ops alone does not pull
+# in the config module's pydantic/yaml dependencies.
+_EXPORTS = {
+    "ForgeConfig": "forge.core.config",
+    "load_config": "forge.core.config",
+    "save_config": "forge.core.config",
+    "detect_language": "forge.core.config",
+    "get_config_path": "forge.core.config",
+    "load_env_file": "forge.core.config",
+    "find_repo_root": "forge.core.git_ops",
+    "is_git_repo": "forge.core.git_ops",
+    "get_repo_status": "forge.core.git_ops",
+    "RepoStatus": "forge.core.git_ops",
+    "get_current_branch": "forge.core.git_ops",
+    "sync_branch": "forge.core.git_ops",
+    "stage_files": "forge.core.git_ops",
+    "commit_changes": "forge.core.git_ops",
+    "commit_all_changes": "forge.core.git_ops",
+    "push_branch": "forge.core.git_ops",
+    "is_clean_working_tree": "forge.core.git_ops",
+    "run_git_command": "forge.core.git_ops",
+    "create_branch": "forge.core.git_ops",
+    "branch_exists": "forge.core.git_ops",
+    "switch_branch": "forge.core.git_ops",
+    "list_branches": "forge.core.git_ops",
+    "detect_main_branch": "forge.core.git_ops",
+    "branch_exists_local": "forge.core.git_ops",
+    "get_changed_source_files": "forge.core.diff",
+}
 
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
@@ -1,12 +1,16 @@
 """Configuration management for Forge"""
 
+import hashlib
+import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-import yaml
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any
 
+from forge.core.git_ops import find_repo_root
+
 try:
     from dotenv import load_dotenv
 except ImportError:
@@ -30,26 +34,12 @@ class ForgeConfig(BaseModel):
     include: list[str] = ["src/"]
     exclude: list[str] = ["venv/", "node_modules/"]
     ai: Optional[Dict[str, Any]] = None  # AI configuration section
+    max_parallel: Optional[int] = Field(None, ge=1)  # concurrent AI requests when generating tests
 
 
 CONFIG_FILE = ".fg.yml"
 
 
-def find_repo_root(start_path: Optional[Path] = None) -> Optional[Path]:
-    """Find the Git repository root by looking for .git directory"""
-    if start_path is None:
-        start_path = Path.cwd()
-    
-    current = Path(start_path).resolve()
-    
-    while current != current.parent:
-        if (current / ".git").exists():
-            return current
-        current = current.parent
-    
-    return None
-
-
 def get_config_path(repo_root: Optional[Path] = None) -> Path:
     """Get the path to the Forge config file"""
     if repo_root is None:
@@ -64,14 +54,35 @@ def load_config(repo_root: Optional[Path] = None) -> ForgeConfig:
     """Load Forge configuration from .fg.yml"""
     config_path = get_config_path(repo_root)
     
-    if not config_path.exists():
+    try:
+        st = os.stat(config_path)
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Forge not initialized. Run 'forge init' first. "
             f"Expected config at {config_path}"
         )
     
-    with open(config_path, "r") as f:
-        data = yaml.safe_load(f) or {}
+    # Parsed configs are cached per file version; hand out copies so callers
+    # can never mutate the cached instance. Size and inode join the mtime so
+    # a same-tick edit or an editor's atomic rename still looks new.
+    version = (st.st_mtime_ns, st.st_size, st.st_ino)
+    return _load_config(str(config_path), version).model_copy(deep=True)
+
+
+@lru_cache(maxsize=8)
+def _load_config(config_path: str, version: tuple) -> ForgeConfig:
+    """Parse a config file (memoized per path and file version)"""
+    # A JSON copy of the parsed YAML, kept per config file version, lets
+    # later processes skip importing PyYAML and parsing altogether
+    data = _read_cached_config(config_path, version)
+    if data is None:
+        import yaml
+        
+        # Prefer the libyaml-backed loader when PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with open(config_path, "r") as f:
+            data = yaml.load(f, Loader=loader) or {}
+        _write_cached_config(config_path, version, data)
     
     # Handle AI config section if present
     if "ai" in data and isinstance(data["ai"], dict):
@@ -81,14 +92,58 @@ def load_config(repo_root: Optional[Path] = None) -> ForgeConfig:
     return ForgeConfig(**data)
 
 
+def _config_cache_path(config_path: str) -> Path:
+    """Location of the parsed-config cache for a config file"""
+    digest = hashlib.sha1(config_path.encode()).hexdigest()
+    return Path.home() / ".forge" / "config-cache" / f"{digest}.json"
+
+
+def _read_cached_config(config_path: str, version: tuple) -> Optional[dict]:
+    """Return cached parsed config data if it matches this file version"""
+    try:
+        with open(_config_cache_path(config_path), "rb") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if cached.get("path") != config_path or cached.get("version") != list(version):
+        return None
+    return cached.get("data")
+
+
+def _write_cached_config(config_path: str, version: tuple, data: dict) -> None:
+    """Store parsed config data for later processes (best effort)"""
+    cache_path = _config_cache_path(config_path)
+    try:
+        payload = json.dumps({"path": config_path, "version": list(version), "data": data})
+    except (TypeError, ValueError):
+        return  # YAML values with no JSON form are simply not cached
+    
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(payload)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
 def save_config(config: ForgeConfig, repo_root: Optional[Path] = None) -> None:
     """Save Forge configuration to .fg.yml"""
+    import yaml
+    
     config_path = get_config_path(repo_root)
     
     config_dict = config.model_dump()
     
     with open(config_path, "w") as f:
-        yaml.dump(config_dict, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(
+            config_dict,
+            f,
+            Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+            default_flow_style=False,
+            sort_keys=False,
+        )
     
     # Ensure config file is in .gitignore if it exists
     repo_root = repo_root or find_repo_root()
@@ -112,19 +167,34 @@ def load_env_file(repo_root: Optional[Path] = None) -> None:
     
     if repo_root:
         env_file = repo_root / ".env"
-        if env_file.exists():
-            # Load .env file - override=False means don't override existing env vars
-            # This will load env vars from .env if they don't already exist in environment
-            # load_dotenv can take the path as first positional argument or as dotenv_path keyword
-            load_dotenv(str(env_file), override=False)
-        # Note: We don't raise an error if .env doesn't exist - API keys can be set via environment variables
+        try:
+            mtime_ns = os.stat(env_file).st_mtime_ns
+        except FileNotFoundError:
+            # Note: We don't raise an error if .env doesn't exist - API keys can be set via environment variables
+            return
+        _load_env_file(str(env_file), mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _load_env_file(env_file: str, mtime_ns: int) -> None:
+    """Load a .env file once per path and modification time"""
+    # Load .env file - override=False means don't override existing env vars
+    # This will load env vars from .env if they don't already exist in environment
+    # load_dotenv can take the path as first positional argument or as dotenv_path keyword
+    load_dotenv(env_file, override=False)
 
 
 def detect_language(repo_root: Path) -> str:
     """Detect the primary language of the repository"""
-    # Check for Python files
-    python_files = list(repo_root.rglob("*.py"))
-    if python_files:
+    # Memoized per root directory version, like the adapters' tree walks
+    return _detect_language(str(repo_root), os.stat(repo_root).st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _detect_language(repo_root: str, mtime_ns: int) -> str:
+    """Detect the language of repo_root (memoized per path and modification time)"""
+    # Check for Python files (the first match is enough)
+    if next(Path(repo_root).rglob("*.py"), None) is not None:
         return "python"
     
     # Future: Add detection for other languages
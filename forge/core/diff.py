@@ -1,45 +1,51 @@
 """File diff and change detection utilities"""
 
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from forge.core.config import load_config, find_repo_root
 from forge.core.git_ops import get_changed_files_since_base
 
 
+def compile_patterns(patterns: list[str]) -> Optional[re.Pattern]:
+    """Fuse substring patterns into one compiled regex (None if there are none)"""
+    if not patterns:
+        return None
+    # The same include/exclude lists recur on every lookup within a command
+    return _compile_patterns(tuple(patterns))
+
+
+@lru_cache(maxsize=16)
+def _compile_patterns(patterns: tuple[str, ...]) -> re.Pattern:
+    """Build the fused regex for a tuple of patterns (memoized)"""
+    return re.compile("|".join(re.escape(pattern) for pattern in patterns))
+
+
 def filter_source_files(
     files: list[str],
     include_patterns: list[str],
     exclude_patterns: list[str],
-    extensions: list[str],
+    extensions: tuple[str, ...],
 ) -> list[str]:
     """Filter files based on include/exclude patterns and extensions"""
     filtered = []
+    extensions = tuple(extensions)
+    exclude_re = compile_patterns(exclude_patterns)
+    include_re = compile_patterns(include_patterns)
     
     for file_path in files:
-        path = Path(file_path)
-        
-        # Check extension
-        if path.suffix not in extensions:
+        # Check extension (str.endswith with a tuple, no Path objects)
+        if not file_path.endswith(extensions):
             continue
         
         # Check exclude patterns
-        excluded = False
-        for pattern in exclude_patterns:
-            if pattern in str(path):
-                excluded = True
-                break
-        if excluded:
+        if exclude_re and exclude_re.search(file_path):
             continue
         
         # Check include patterns (if any specified)
-        if include_patterns:
-            included = False
-            for pattern in include_patterns:
-                if pattern in str(path):
-                    included = True
-                    break
-            if not included:
-                continue
+        if include_re and not include_re.search(file_path):
+            continue
         
         filtered.append(file_path)
     
@@ -64,9 +70,9 @@ def get_changed_source_files(
     
     # Filter based on language
     if config.language == "python":
-        extensions = [".py"]
+        extensions = (".py",)
     else:
-        extensions = [".py"]  # Default to Python for MVP
+        extensions = (".py",)  # Default to Python for MVP
     
     # Filter source files
     source_files = filter_source_files(
@@ -1,7 +1,10 @@
 """Git operations for Forge"""
 
+import os
 import subprocess
 import sys
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -34,6 +37,68 @@ def run_git_command(
         raise
 
 
+def find_repo_root(start_path: Optional[Path] = None) -> Optional[Path]:
+    """Find the Git repository root by looking for .git directory"""
+    if start_path is None:
+        start_path = os.getcwd()
+    
+    return _find_repo_root(str(start_path))
+
+
+@lru_cache(maxsize=4)
+def _find_repo_root(start_path: str) -> Optional[Path]:
+    """
+    Walk up from start_path to the directory containing .git
+    
+    Memoized per start path, including negative (None) results, so repeated
+    lookups within one process never repeat the upward stat() chain.
+    """
+    current = Path(start_path).resolve()
+    
+    while current != current.parent:
+        if (current / ".git").exists():
+            return current
+        current = current.parent
+    
+    return None
+
+
+@dataclass(frozen=True)
+class RepoStatus:
+    """Repository facts gathered by a single ``git rev-parse``"""
+    
+    is_repo: bool
+    current_branch: Optional[str]
+    toplevel: Optional[Path]
+
+
+def get_repo_status(start_path: Optional[Path] = None) -> RepoStatus:
+    """
+    Probe repository membership, current branch and root in one git call
+    
+    Args:
+        start_path: Directory to probe (defaults to the current directory)
+    
+    Returns:
+        RepoStatus; current_branch is None when HEAD has no commits yet
+    """
+    result = run_git_command(
+        ["rev-parse", "--is-inside-work-tree", "--abbrev-ref", "HEAD", "--show-toplevel"],
+        repo_root=start_path,
+        check=False,
+    )
+    lines = result.stdout.splitlines()
+    
+    if result.returncode == 0 and len(lines) == 3:
+        return RepoStatus(lines[0] == "true", lines[1], Path(lines[2]))
+    
+    # rev-parse stops at an unborn HEAD after confirming the work tree, so
+    # fall back to the filesystem for the root
+    if lines and lines[0] == "true":
+        return RepoStatus(True, None, find_repo_root(start_path))
+    return RepoStatus(False, None, None)
+
+
 def is_git_repo(path: Optional[Path] = None) -> bool:
     """Check if the current directory is a Git repository"""
     if path is None:
@@ -53,9 +118,22 @@ def fetch_origin(repo_root: Optional[Path] = None) -> None:
     run_git_command(["fetch", "origin"], repo_root=repo_root)
 
 
-def sync_branch(base_branch: str, repo_root: Optional[Path] = None) -> None:
-    """Rebase current branch onto base branch"""
-    current_branch = get_current_branch(repo_root)
+def sync_branch(
+    base_branch: str,
+    repo_root: Optional[Path] = None,
+    current_branch: Optional[str] = None,
+) -> None:
+    """
+    Rebase current branch onto base branch
+    
+    Args:
+        base_branch: Branch to rebase onto (as origin/<base_branch>)
+        repo_root: Repository root (defaults to the current directory)
+        current_branch: Current branch name when the caller already knows
+            it, saving a rev-parse
+    """
+    if current_branch is None:
+        current_branch = get_current_branch(repo_root)
     
     if current_branch == base_branch:
         raise ValueError(
@@ -106,11 +184,31 @@ def detect_main_branch(repo_root: Optional[Path] = None) -> str:
     Raises:
         RuntimeError: If none of the expected main branches exist
     """
+    # Memoized per repository for the life of the process; the main branch
+    # does not change while a command runs. Failures are not cached.
+    return _detect_main_branch(str(repo_root) if repo_root is not None else os.getcwd())
+
+
+@lru_cache(maxsize=4)
+def _detect_main_branch(repo_root: str) -> str:
+    """Detect the main branch of repo_root (memoized per repository)"""
     # Try standard branch names first
     candidates = ["main", "master", "fg/main", "fg/master"]
     
+    # One for-each-ref lists whichever candidates exist; it sorts by refname,
+    # so the candidate order above decides the winner. Full refnames are
+    # compared because the short form turns into "heads/main" when a tag of
+    # the same name exists.
+    result = run_git_command(
+        ["for-each-ref", "--format=%(refname)"]
+        + [f"refs/heads/{branch_name}" for branch_name in candidates],
+        repo_root=Path(repo_root),
+        check=False,
+    )
+    existing = set(result.stdout.split())
+    
     for branch_name in candidates:
-        if branch_exists_local(branch_name, repo_root):
+        if f"refs/heads/{branch_name}" in existing:
             return branch_name
     
     # None of the expected branches exist
@@ -123,12 +221,24 @@ def detect_main_branch(repo_root: Optional[Path] = None) -> str:
 def get_changed_files_since_base(
     base_branch: str,
     repo_root: Optional[Path] = None,
+    pathspecs: Optional[list[str]] = None,
 ) -> list[str]:
-    """Get list of files changed since base branch"""
-    current_branch = get_current_branch(repo_root)
+    """
+    Get list of files changed since base branch
+    
+    Deleted files are left out. Pass pathspecs (e.g. ["*.py"]) to have git
+    filter the paths instead of post-filtering in Python.
+    """
+    # A single rev-parse both names the current branch and verifies that the
+    # base branch exists (it fails if either cannot be resolved)
+    head = run_git_command(
+        ["rev-parse", "--abbrev-ref", "HEAD", f"refs/heads/{base_branch}"],
+        repo_root=repo_root,
+        check=False,
+    )
     
     # Check if base branch exists
-    if not branch_exists_local(base_branch, repo_root):
+    if head.returncode != 0 and not branch_exists_local(base_branch, repo_root):
         # Try to get list of available branches for better error message
         try:
             result = run_git_command(
@@ -151,28 +261,26 @@ def get_changed_files_since_base(
                 f"Use 'forge switch <branch>' to switch branches or update base_branch in .fg.yml"
             )
     
+    if head.returncode == 0:
+        current_branch = head.stdout.splitlines()[0].strip()
+    else:
+        current_branch = get_current_branch(repo_root)
+    
+    # NUL-separated output needs no unquoting of unusual file names
+    diff_args = ["diff", "--name-only", "-z", "--diff-filter=d"]
+    path_args = ["--"] + list(pathspecs) if pathspecs else []
+    
     # If we're on the base branch, check for uncommitted changes instead
     if current_branch == base_branch:
         try:
-            # Get uncommitted changes (staged + unstaged)
+            # Diffing the working tree against HEAD covers both staged and
+            # unstaged changes, so one diff is enough
             result = run_git_command(
-                ["diff", "--name-only", "HEAD"],
+                diff_args + ["HEAD"] + path_args,
                 repo_root=repo_root,
                 check=True,
             )
-            files = [f.strip() for f in result.stdout.strip().split("\n") if f.strip()]
-            
-            # Also check staged changes
-            result_staged = run_git_command(
-                ["diff", "--name-only", "--cached", "HEAD"],
-                repo_root=repo_root,
-                check=True,
-            )
-            staged_files = [f.strip() for f in result_staged.stdout.strip().split("\n") if f.strip()]
-            
-            # Combine and deduplicate
-            all_files = list(set(files + staged_files))
-            return all_files
+            return [f for f in result.stdout.split("\0") if f]
         except RuntimeError:
             # If no uncommitted changes, return empty list
             return []
@@ -180,12 +288,11 @@ def get_changed_files_since_base(
     # Compare current branch against base branch
     try:
         result = run_git_command(
-            ["diff", "--name-only", f"{base_branch}...HEAD"],
+            diff_args + [f"{base_branch}...HEAD"] + path_args,
             repo_root=repo_root,
             check=True,
         )
-        files = [f.strip() for f in result.stdout.strip().split("\n") if f.strip()]
-        return files
+        return [f for f in result.stdout.split("\0") if f]
     except RuntimeError as e:
         # If diff fails, it might be because HEAD is the same as base_branch
         if "ambiguous argument" in str(e).lower() or "unknown revision" in str(e).lower():
@@ -201,7 +308,7 @@ def stage_files(files: list[str], repo_root: Optional[Path] = None) -> None:
     if not files:
         return
     
-    run_git_command(["add"] + files, repo_root=repo_root)
+    run_git_command(["add", "--"] + files, repo_root=repo_root)
 
 
 def commit_changes(message: str, repo_root: Optional[Path] = None) -> None:
@@ -209,6 +316,33 @@ def commit_changes(message: str, repo_root: Optional[Path] = None) -> None:
     run_git_command(["commit", "-m", message], repo_root=repo_root)
 
 
+def commit_all_changes(message: str, repo_root: Optional[Path] = None) -> bool:
+    """
+    Stage every change (including untracked files) and commit it
+    
+    Replaces a status check plus add plus commit: a clean tree is only
+    looked for once the commit attempt has failed.
+    
+    Returns:
+        True if a commit was made, False if there was nothing to commit
+    """
+    run_git_command(["add", "-A"], repo_root=repo_root)
+    
+    result = run_git_command(["commit", "-m", message], repo_root=repo_root, check=False)
+    if result.returncode == 0:
+        return True
+    
+    # An empty index diff means the commit failed for lack of changes (git's
+    # own "nothing to commit" message is localized, so it is not matched)
+    staged = run_git_command(["diff", "--cached", "--quiet"], repo_root=repo_root, check=False)
+    if staged.returncode == 0:
+        return False
+    raise RuntimeError(
+        f"Git command failed: git commit -m {message}\n"
+        f"{result.stderr or result.stdout or 'Unknown git error'}"
+    )
+
+
 def push_branch(branch: Optional[str] = None, repo_root: Optional[Path] = None) -> None:
     """Push branch to remote"""
     if branch is None:
@@ -233,23 +367,20 @@ def is_clean_working_tree(repo_root: Optional[Path] = None) -> bool:
 
 def branch_exists(branch_name: str, repo_root: Optional[Path] = None) -> bool:
     """Check if a branch exists (local or remote)"""
+    local_ref = f"refs/heads/{branch_name}"
+    remote_ref = f"refs/remotes/origin/{branch_name}"
     try:
-        # Check local branches
-        result = run_git_command(
-            ["show-ref", "--verify", "--quiet", f"refs/heads/{branch_name}"],
-            repo_root=repo_root,
-            check=False,
-        )
-        if result.returncode == 0:
-            return True
-        
-        # Check remote branches
+        # One for-each-ref checks both the local and the remote ref. Its
+        # patterns also match refs nested below them, so compare exactly.
         result = run_git_command(
-            ["show-ref", "--verify", "--quiet", f"refs/remotes/origin/{branch_name}"],
+            ["for-each-ref", "--format=%(refname)", local_ref, remote_ref],
             repo_root=repo_root,
             check=False,
         )
-        return result.returncode == 0
+        if result.returncode != 0:
+            return False
+        refs = result.stdout.splitlines()
+        return local_ref in refs or remote_ref in refs
     except Exception:
         return False
 
@@ -6,6 +6,8 @@ from forge.database.models import (
     Commit,
     TestEvent,
     get_session,
+    get_async_session,
+    get_scoped_session,
     init_db,
 )
 
@@ -15,6 +17,8 @@ __all__ = [
     "Commit",
     "TestEvent",
     "get_session",
+    "get_async_session",
+    "get_scoped_session",
     "init_db",
 ]
 
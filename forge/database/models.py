@@ -1,5 +1,6 @@
 """SQLite database models for Forge multi-repo tracking"""
 
+from asyncio import current_task
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -10,7 +11,16 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     Boolean,
+    Index,
     create_engine,
+    inspect,
+    text,
+)
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_scoped_session,
+    async_sessionmaker,
+    create_async_engine,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship, Session
@@ -28,23 +38,109 @@ def get_db_path() -> Path:
     return DB_PATH
 
 
+# Connection pool settings shared by the sync and async engines, sized for
+# the API backend serving many concurrent requests
+_POOL_OPTIONS = {
+    "pool_size": 20,
+    "max_overflow": 10,
+    "pool_timeout": 30,
+    "pool_pre_ping": True,
+    "pool_recycle": 3600,
+}
+
+# Engines and session factories are created once per process, on first use
+_engine = None
+_SessionLocal = None
+_async_engine = None
+_AsyncSessionLocal = None
+_AsyncScopedSession = None
+
+
 def get_engine():
-    """Get SQLAlchemy engine"""
-    db_path = get_db_path()
-    return create_engine(f"sqlite:///{db_path}", echo=False)
+    """Get the shared SQLAlchemy engine"""
+    global _engine
+    if _engine is None:
+        db_path = get_db_path()
+        _engine = create_engine(f"sqlite:///{db_path}", echo=False, **_POOL_OPTIONS)
+    return _engine
 
 
 def get_session() -> Session:
     """Get a database session"""
-    engine = get_engine()
-    SessionLocal = sessionmaker(bind=engine)
-    return SessionLocal()
+    global _SessionLocal
+    if _SessionLocal is None:
+        _SessionLocal = sessionmaker(bind=get_engine())
+    return _SessionLocal()
+
+
+def get_async_engine():
+    """Get the shared async SQLAlchemy engine (aiosqlite)"""
+    global _async_engine
+    if _async_engine is None:
+        db_path = get_db_path()
+        _async_engine = create_async_engine(
+            f"sqlite+aiosqlite:///{db_path}",
+            echo=False,
+            **_POOL_OPTIONS,
+        )
+    return _async_engine
+
+
+def _get_async_sessionmaker() -> async_sessionmaker:
+    """Get the shared async session factory"""
+    global _AsyncSessionLocal
+    if _AsyncSessionLocal is None:
+        _AsyncSessionLocal = async_sessionmaker(get_async_engine(), expire_on_commit=False)
+    return _AsyncSessionLocal
+
+
+def get_async_session() -> AsyncSession:
+    """Get an async database session"""
+    return _get_async_sessionmaker()()
+
+
+def get_scoped_session() -> async_scoped_session:
+    """
+    Get the task-scoped async session registry
+    
+    Calling the registry returns the session for the current asyncio task
+    (one per request); call ``remove()`` once the request is done.
+    """
+    global _AsyncScopedSession
+    if _AsyncScopedSession is None:
+        _AsyncScopedSession = async_scoped_session(
+            _get_async_sessionmaker(),
+            scopefunc=current_task,
+        )
+    return _AsyncScopedSession
 
 
 def init_db():
-    """Initialize the database (create tables)"""
+    """Initialize the database (create tables and indexes)"""
     engine = get_engine()
     Base.metadata.create_all(engine)
+    
+    # create_all skips tables that already exist, so add columns and indexes
+    # introduced after a database was first created
+    _add_missing_columns(engine)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+
+
+def _add_missing_columns(engine) -> None:
+    """Add model columns missing from existing tables (ALTER TABLE ADD COLUMN)"""
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                ddl = f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column.type.compile(engine.dialect)}"
+                if column.server_default is not None:
+                    ddl += f" DEFAULT {column.server_default.arg}"
+                conn.execute(text(ddl))
 
 
 class Repository(Base):
@@ -72,6 +168,9 @@ class Branch(Base):
     """Branch tracking model"""
 
     __tablename__ = "branches"
+    __table_args__ = (
+        Index("ix_branch_repo", "repo_id"),
+    )
 
     id = Column(Integer, primary_key=True)
     repo_id = Column(Integer, ForeignKey("repositories.id"), nullable=False)
@@ -81,6 +180,7 @@ class Branch(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     last_synced_at = Column(DateTime, nullable=True)
     status = Column(String, default="active")  # active | merged | stale
+    commits_behind_base = Column(Integer, default=0, server_default="0")  # refreshed on scan
 
     # Relationships
     repository = relationship("Repository", back_populates="branches")
@@ -95,6 +195,10 @@ class Commit(Base):
     """Commit history model"""
 
     __tablename__ = "commits"
+    __table_args__ = (
+        # Backs a branch's commit history ordered newest first
+        Index("ix_commit_branch_ts", "branch_id", "timestamp"),
+    )
 
     id = Column(Integer, primary_key=True)
     commit_hash = Column(String, nullable=False)
@@ -119,6 +223,12 @@ class TestEvent(Base):
     """Test generation event tracking"""
 
     __tablename__ = "test_events"
+    __table_args__ = (
+        # Backs the per-branch "has successful test run" existence check
+        Index("ix_testevent_branch_status", "branch_id", "status"),
+        # Backs the per-repo event feed ordered newest first
+        Index("ix_testevent_repo_ts", "repo_id", "timestamp"),
+    )
 
     id = Column(Integer, primary_key=True)
     repo_id = Column(Integer, ForeignKey("repositories.id"), nullable=False)
@@ -1,5 +1,6 @@
 """Repository scanning and data ingestion functions"""
 
+import logging
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
@@ -15,6 +16,8 @@ from forge.core.git_ops import (
 )
 from forge.metadata.branches import get_branch_metadata
 
+logger = logging.getLogger(__name__)
+
 
 def scan_repository(repo_path: Path, session: Optional[Session] = None) -> Repository:
     """
@@ -37,24 +40,7 @@ def scan_repository(repo_path: Path, session: Optional[Session] = None) -> Repos
         should_close = False
 
     try:
-        # Get or create repository
-        repo = session.query(Repository).filter_by(local_path=str(repo_path)).first()
-        if not repo:
-            # Detect base branch
-            try:
-                base_branch = detect_main_branch(repo_path)
-            except RuntimeError:
-                base_branch = "main"
-
-            repo = Repository(
-                name=repo_path.name,
-                local_path=str(repo_path),
-                base_branch=base_branch,
-                date_added=datetime.utcnow(),
-            )
-            session.add(repo)
-            session.commit()
-            session.refresh(repo)
+        repo = _get_or_create_repository(repo_path, session)
 
         # Update last scanned timestamp
         repo.last_scanned_at = datetime.utcnow()
@@ -95,6 +81,12 @@ def scan_repository(repo_path: Path, session: Optional[Session] = None) -> Repos
                 session.commit()
                 session.refresh(branch)
 
+            # Materialize how far the branch trails its base so metrics
+            # requests never have to walk the commit graph
+            branch.commits_behind_base = _count_commits_behind(
+                repo_path, branch_name, branch.base_branch
+            )
+
             # Scan commits for this branch
             _scan_branch_commits(repo_path, repo.id, branch.id, branch_name, session)
 
@@ -106,6 +98,71 @@ def scan_repository(repo_path: Path, session: Optional[Session] = None) -> Repos
             session.close()
 
 
+def register_repository(repo_path: Path, session: Optional[Session] = None) -> Repository:
+    """
+    Get or create the Repository row for a Git repository without scanning it.
+    
+    Args:
+        repo_path: Path to the Git repository
+        session: Optional database session (creates new if not provided)
+    
+    Returns:
+        Repository model instance
+    """
+    if not is_git_repo(repo_path):
+        raise ValueError(f"Not a Git repository: {repo_path}")
+
+    if session is None:
+        session = get_session()
+        should_close = True
+    else:
+        should_close = False
+
+    try:
+        return _get_or_create_repository(repo_path, session)
+    finally:
+        if should_close:
+            session.close()
+
+
+def _get_or_create_repository(repo_path: Path, session: Session) -> Repository:
+    """Get the Repository row for repo_path, creating it if needed"""
+    repo = session.query(Repository).filter_by(local_path=str(repo_path)).first()
+    if not repo:
+        # Detect base branch
+        try:
+            base_branch = detect_main_branch(repo_path)
+        except RuntimeError:
+            base_branch = "main"
+
+        repo = Repository(
+            name=repo_path.name,
+            local_path=str(repo_path),
+            base_branch=base_branch,
+            date_added=datetime.utcnow(),
+        )
+        session.add(repo)
+        session.commit()
+        session.refresh(repo)
+
+    return repo
+
+
+def _count_commits_behind(repo_path: Path, branch_name: str, base_branch: str) -> int:
+    """Count commits on base_branch that are not on branch_name (0 if unknown)"""
+    if branch_name == base_branch:
+        return 0
+
+    result = run_git_command(
+        ["rev-list", "--count", f"{branch_name}..{base_branch}"],
+        repo_path,
+        check=False,
+    )
+    if result.returncode != 0:
+        return 0
+    return int(result.stdout.strip() or 0)
+
+
 def _scan_branch_commits(
     repo_path: Path,
     repo_id: int,
@@ -192,5 +249,5 @@ def _scan_branch_commits(
 
     except Exception as e:
         # Log error but don't fail
-        print(f"Error scanning commits for branch {branch_name}: {e}")
+        logger.warning("Error scanning commits for branch %s: %s", branch_name, e)
 
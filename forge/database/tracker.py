@@ -2,11 +2,13 @@
 
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
-from sqlalchemy.orm import Session
+from typing import TYPE_CHECKING, Optional
 
 from forge.database.models import Repository, Branch, TestEvent, get_session, init_db
-from forge.core.config import find_repo_root
+from forge.core.git_ops import find_repo_root
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
 
 
 def track_test_event(
@@ -16,7 +18,7 @@ def track_test_event(
     model: Optional[str] = None,
     repo_path: Optional[Path] = None,
     branch_name: Optional[str] = None,
-    session: Optional[Session] = None,
+    session: Optional["Session"] = None,
 ):
     """
     Track a test generation event in the database.
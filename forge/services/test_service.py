@@ -94,25 +94,52 @@ class TestService:
         Returns:
             Generated test code
         """
+        prompt = self._prompt_for_file(file_path, code, existing_test_code, incremental)
+        if prompt is None:
+            return ""
+        
+        return self.provider.generate_tests(prompt)
+    
+    async def agenerate_tests_for_file(
+        self,
+        file_path: str,
+        code: str,
+        test_file_path: Path,
+        existing_test_code: Optional[str] = None,
+        incremental: bool = False,
+    ) -> str:
+        """Async variant of generate_tests_for_file (same arguments and result)"""
+        prompt = self._prompt_for_file(file_path, code, existing_test_code, incremental)
+        if prompt is None:
+            return ""
+        
+        return await self.provider.agenerate_tests(prompt)
+    
+    def _prompt_for_file(
+        self,
+        file_path: str,
+        code: str,
+        existing_test_code: Optional[str],
+        incremental: bool,
+    ) -> Optional[str]:
+        """Build the prompt for a file, or None if there is nothing left to test"""
         if incremental and existing_test_code:
             # Find untested functions
             untested_funcs = get_untested_functions_with_info(code, existing_test_code)
             if not untested_funcs:
-                # All functions already tested, return empty string
-                return ""
+                # All functions already tested
+                return None
             
             # Extract code for only untested functions
             function_names = [f.name for f in untested_funcs]
             function_code = extract_code_for_functions(code, function_names)
             
             if not function_code or not function_code.strip():
-                return ""
+                return None
             
-            prompt = self._build_prompt_for_functions(file_path, function_code, function_names)
-        else:
-            prompt = self._build_prompt(file_path, code)
+            return self._build_prompt_for_functions(file_path, function_code, function_names)
         
-        return self.provider.generate_tests(prompt)
+        return self._build_prompt(file_path, code)
     
     def _build_prompt(self, file_path: str, code: str) -> str:
         """Build the prompt for test generation"""
@@ -1,9 +1,17 @@
 """Validation utilities for Forge"""
 
+import re
 from pathlib import Path
 from typing import Optional
 from forge.core.git_ops import is_git_repo, run_git_command, is_clean_working_tree
 
+# Branch name patterns, compiled once at import
+_SEPARATOR_RUN_RE = re.compile(r'[\s_]+')
+_INVALID_CHAR_RE = re.compile(r'[^a-z0-9/-]')
+_HYPHEN_RUN_RE = re.compile(r'-+')
+_SLASH_RUN_RE = re.compile(r'/+')
+_GIT_FORBIDDEN_CHAR_RE = re.compile(r'[~^:?*\[\]\\]')
+
 
 def assert_git_repo(repo_root: Optional[Path] = None) -> Path:
     """Assert that we're in a Git repository, return repo root"""
@@ -85,19 +93,17 @@ def normalize_branch_name(name: str, prefix: str = "fg/") -> str:
     Returns:
         Normalized branch name
     """
-    import re
-    
     # Lowercase
     normalized = name.lower()
     
     # Replace spaces and multiple hyphens/underscores with single hyphen
-    normalized = re.sub(r'[\s_]+', '-', normalized)
+    normalized = _SEPARATOR_RUN_RE.sub('-', normalized)
     
     # Remove invalid characters (keep alphanumeric, hyphens, forward slashes)
-    normalized = re.sub(r'[^a-z0-9/-]', '', normalized)
+    normalized = _INVALID_CHAR_RE.sub('', normalized)
     
     # Remove multiple consecutive hyphens
-    normalized = re.sub(r'-+', '-', normalized)
+    normalized = _HYPHEN_RUN_RE.sub('-', normalized)
     
     # Remove leading/trailing hyphens
     normalized = normalized.strip('-')
@@ -107,7 +113,7 @@ def normalize_branch_name(name: str, prefix: str = "fg/") -> str:
         normalized = prefix + normalized
     
     # Remove duplicate slashes
-    normalized = re.sub(r'/+', '/', normalized)
+    normalized = _SLASH_RUN_RE.sub('/', normalized)
     
     if not normalized or normalized == prefix:
         raise ValueError(f"Invalid branch name: '{name}'")
@@ -117,8 +123,6 @@ def normalize_branch_name(name: str, prefix: str = "fg/") -> str:
 
 def validate_branch_name(name: str) -> bool:
     """Validate that branch name follows Git conventions"""
-    import re
-    
     # Git branch name rules:
     # - Cannot contain consecutive dots (..)
     # - Cannot end with .lock
@@ -138,7 +142,7 @@ def validate_branch_name(name: str) -> bool:
         return False
     
     # Check for invalid characters (Git allows most, but we're conservative)
-    if re.search(r'[~^:?*\[\]\\]', name):
+    if _GIT_FORBIDDEN_CHAR_RE.search(name):
         return False
     
     return True
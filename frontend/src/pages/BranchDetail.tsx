@@ -1,6 +1,10 @@
 import { useEffect, useState } from "react";
 import { useParams, useNavigate } from "react-router-dom";
-import { getBranchCommits, getBranchMetrics } from "../utils/api";
+import {
+  COMMIT_PAGE_SIZE,
+  getBranchCommits,
+  getBranchMetrics,
+} from "../utils/api";
 import type { Commit, BranchMetrics } from "../types";
 
 export default function BranchDetail() {
@@ -9,6 +13,8 @@ export default function BranchDetail() {
   const [commits, setCommits] = useState<Commit[]>([]);
   const [metrics, setMetrics] = useState<BranchMetrics | null>(null);
   const [loading, setLoading] = useState(true);
+  const [hasMore, setHasMore] = useState(false);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     if (branchId) {
@@ -25,6 +31,7 @@ export default function BranchDetail() {
         getBranchMetrics(parseInt(branchId)),
       ]);
       setCommits(commitsData);
+      setHasMore(commitsData.length === COMMIT_PAGE_SIZE);
       setMetrics(metricsData);
     } catch (err) {
       console.error("Failed to load data:", err);
@@ -33,6 +40,23 @@ export default function BranchDetail() {
     }
   }
 
+  async function loadMore() {
+    if (!branchId || commits.length === 0) return;
+    try {
+      setLoadingMore(true);
+      const page = await getBranchCommits(
+        parseInt(branchId),
+        commits[commits.length - 1]
+      );
+      setCommits([...commits, ...page]);
+      setHasMore(page.length === COMMIT_PAGE_SIZE);
+    } catch (err) {
+      console.error("Failed to load more commits:", err);
+    } finally {
+      setLoadingMore(false);
+    }
+  }
+
   if (loading) {
     return <div className="loading">Loading...</div>;
   }
@@ -76,7 +100,10 @@ export default function BranchDetail() {
       )}
 
       <div className="card">
-        <h2>💻 Commits ({commits.length})</h2>
+        <h2>
+          💻 Commits ({commits.length}
+          {hasMore ? "+" : ""})
+        </h2>
         {commits.length === 0 ? (
           <div className="empty-state">
             <div className="empty-state-icon">📝</div>
@@ -112,6 +139,15 @@ export default function BranchDetail() {
                 </div>
               </div>
             ))}
+            {hasMore && (
+              <button
+                className="btn btn-secondary"
+                onClick={loadMore}
+                disabled={loadingMore}
+              >
+                {loadingMore ? "⏳ Loading..." : "Load more commits"}
+              </button>
+            )}
           </div>
         )}
       </div>
@@ -1,6 +1,6 @@
-import { useEffect, useState } from "react";
+import { useEffect, useRef, useState } from "react";
 import { useParams, useNavigate } from "react-router-dom";
-import { getRepoBranches, scanRepo, getRepos } from "../utils/api";
+import { getRepoBranches, scanRepo, getRepos, waitForScan } from "../utils/api";
 import type { Branch, Repository } from "../types";
 
 export default function RepositoryDetail() {
@@ -11,21 +11,28 @@ export default function RepositoryDetail() {
   const [loading, setLoading] = useState(true);
   const [scanning, setScanning] = useState(false);
 
+  // Stops scan polling once the page is left or shows another repository
+  const polling = useRef(new AbortController());
+
   useEffect(() => {
+    const controller = new AbortController();
+    polling.current = controller;
     if (repoId) {
-      loadData();
+      loadData(true);
     }
+    return () => controller.abort();
   }, [repoId]);
 
-  async function loadData() {
+  async function loadData(awaitPendingScan: boolean) {
     if (!repoId) return;
+    let foundRepo: Repository | undefined;
     try {
       setLoading(true);
       const [reposData, branchesData] = await Promise.all([
         getRepos(),
         getRepoBranches(parseInt(repoId)),
       ]);
-      const foundRepo = reposData.find((r) => r.id === parseInt(repoId));
+      foundRepo = reposData.find((r) => r.id === parseInt(repoId));
       setRepo(foundRepo || null);
       setBranches(branchesData);
     } catch (err) {
@@ -33,6 +40,25 @@ export default function RepositoryDetail() {
     } finally {
       setLoading(false);
     }
+
+    // A newly added repository is scanned in the background; show its
+    // branches once that first scan finishes
+    if (awaitPendingScan && foundRepo && foundRepo.last_scanned_at === null) {
+      await refreshAfterScan(null);
+    }
+  }
+
+  async function refreshAfterScan(previousScan: string | null) {
+    if (!repoId) return;
+    try {
+      setScanning(true);
+      const scanned = await waitForScan(parseInt(repoId), previousScan, polling.current.signal);
+      if (scanned) {
+        await loadData(false);
+      }
+    } finally {
+      setScanning(false);
+    }
   }
 
   async function handleScan() {
@@ -40,7 +66,7 @@ export default function RepositoryDetail() {
     try {
       setScanning(true);
       await scanRepo(parseInt(repoId));
-      loadData();
+      await refreshAfterScan(repo?.last_scanned_at ?? null);
     } catch (err) {
       console.error("Failed to scan:", err);
     } finally {
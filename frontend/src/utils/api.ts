@@ -41,12 +41,58 @@ export async function scanRepo(repoId: number): Promise<void> {
   }
 }
 
+const SCAN_POLL_INTERVAL_MS = 1000;
+const SCAN_POLL_TIMEOUT_MS = 120000;
+
+// Scans run in the background (POST /scan answers 202 straight away), so
+// poll the repository until its last_scanned_at moves past `since`. Resolves
+// with the refreshed repository, or undefined on timeout or abort.
+export async function waitForScan(
+  repoId: number,
+  since: string | null,
+  signal?: AbortSignal
+): Promise<Repository | undefined> {
+  const deadline = Date.now() + SCAN_POLL_TIMEOUT_MS;
+  while (Date.now() < deadline && !signal?.aborted) {
+    await new Promise((resolve) => setTimeout(resolve, SCAN_POLL_INTERVAL_MS));
+    if (signal?.aborted) break;
+    const repo = (await getRepos()).find((r) => r.id === repoId);
+    if (repo && repo.last_scanned_at && repo.last_scanned_at !== since) {
+      return repo;
+    }
+  }
+  return undefined;
+}
+
+const BRANCH_PAGE_SIZE = 1000;
+export const COMMIT_PAGE_SIZE = 50;
+
+// The branches endpoint is paginated; fetch every page
 export async function getRepoBranches(repoId: number): Promise<Branch[]> {
-  return fetchAPI<Branch[]>(`/repos/${repoId}/branches`);
+  const branches: Branch[] = [];
+  for (let offset = 0; ; offset += BRANCH_PAGE_SIZE) {
+    const page = await fetchAPI<Branch[]>(
+      `/repos/${repoId}/branches?limit=${BRANCH_PAGE_SIZE}&offset=${offset}`
+    );
+    branches.push(...page);
+    if (page.length < BRANCH_PAGE_SIZE) {
+      return branches;
+    }
+  }
 }
 
-export async function getBranchCommits(branchId: number): Promise<Commit[]> {
-  return fetchAPI<Commit[]>(`/branches/${branchId}/commits`);
+// One page of a branch's commits, newest first. Pass the last commit of the
+// previous page as `after` to fetch the next one.
+export async function getBranchCommits(
+  branchId: number,
+  after?: Commit
+): Promise<Commit[]> {
+  const params = new URLSearchParams({ limit: COMMIT_PAGE_SIZE.toString() });
+  if (after) {
+    params.append("cursor", after.timestamp);
+    params.append("cursor_id", after.id.toString());
+  }
+  return fetchAPI<Commit[]>(`/branches/${branchId}/commits?${params.toString()}`);
 }
 
 export async function getBranchMetrics(
@@ -0,0 +1,82 @@
+"""Tests for the branch commit history endpoint"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from forge.backend.app import app, get_db
+from forge.database.models import Base, Branch, Commit, Repository
+
+
+@pytest.fixture
+def client():
+    """Test client backed by an in-memory database with one branch of commits"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def setup():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with Session() as session:
+            session.add(Repository(id=1, name="repo", local_path="/tmp/repo"))
+            session.add(Branch(id=1, repo_id=1, branch_name="main", base_branch="main"))
+            # Five commits, three of them made in the same second
+            timestamps = [
+                datetime(2024, 1, 1, 12, 0, 0),
+                datetime(2024, 1, 1, 12, 0, 1),
+                datetime(2024, 1, 1, 12, 0, 1),
+                datetime(2024, 1, 1, 12, 0, 1),
+                datetime(2024, 1, 1, 12, 0, 2),
+            ]
+            for commit_id, timestamp in enumerate(timestamps, start=1):
+                session.add(Commit(
+                    id=commit_id,
+                    commit_hash=f"{commit_id:040x}",
+                    repo_id=1,
+                    branch_id=1,
+                    author="dev",
+                    timestamp=timestamp,
+                    message=f"commit {commit_id}",
+                ))
+            await session.commit()
+
+    asyncio.run(setup())
+
+    async def override_get_db():
+        async with Session() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        asyncio.run(engine.dispose())
+
+
+def test_commit_pages_keep_ties_across_page_boundary(client):
+    """Commits sharing a timestamp at a page boundary are neither skipped nor repeated"""
+    seen = []
+    params = {"limit": 2}
+    while True:
+        page = client.get("/branches/1/commits", params=params).json()
+        if not page:
+            break
+        seen.extend(commit["id"] for commit in page)
+        last = page[-1]
+        params = {"limit": 2, "cursor": last["timestamp"], "cursor_id": last["id"]}
+
+    assert seen == [5, 4, 3, 2, 1]
+
+
+def test_commit_page_for_missing_branch(client):
+    """Unknown branches return 404"""
+    assert client.get("/branches/99/commits").status_code == 404
@@ -0,0 +1,25 @@
+"""Tests for the Typer CLI wiring"""
+
+from typer.testing import CliRunner
+
+from forge.cli import _COMMANDS, _read_utf8, app, register_commands
+
+
+def test_register_commands_exposes_every_command():
+    """An imported app can be driven directly once commands are registered"""
+    register_commands()
+    register_commands()  # idempotent
+    
+    result = CliRunner().invoke(app, ["--help"])
+    
+    assert result.exit_code == 0
+    for name in _COMMANDS:
+        assert name in result.output
+
+
+def test_read_utf8_normalizes_line_endings(tmp_path):
+    """CRLF test files read for merging come back with plain newlines"""
+    path = tmp_path / "test_mod.py"
+    path.write_bytes(b"def test_a():\r\n    pass\r\n")
+    
+    assert _read_utf8(path) == "def test_a():\n    pass\n"
@@ -0,0 +1,55 @@
+"""Tests for the pytest adapter's sharded runner (used without pytest-xdist)"""
+
+import os
+
+import pytest
+
+from forge.adapters.python.pytest_adapter import PythonPytestAdapter
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A repo whose tests live in nested packages under tests/"""
+    _write(tmp_path / "tests" / "test_a.py", "def test_one():\n    pass\n\ndef test_two():\n    pass\n")
+    _write(
+        tmp_path / "tests" / "src" / "other" / "test_c.py",
+        "def test_three():\n    pass\n\ndef test_four():\n    pass\n",
+    )
+    return tmp_path
+
+
+def _run_sharded(repo, jobs=2):
+    adapter = PythonPytestAdapter()
+    run = adapter._start_sharded(repo, repo / "tests", dict(os.environ), jobs)
+    return adapter.wait_tests(run)
+
+
+def test_sharded_run_passes(repo):
+    """Collected node IDs run across several pytest processes"""
+    assert _run_sharded(repo)
+
+
+def test_sharded_run_with_ini_below_repo_root(repo):
+    """An ini file under tests/ moves pytest's rootdir; node IDs must still resolve"""
+    _write(repo / "tests" / "pytest.ini", "[pytest]\n")
+
+    assert _run_sharded(repo)
+
+
+def test_sharded_run_fails_on_collection_error(repo):
+    """A test module that fails to import fails the run, as it would serially"""
+    _write(repo / "tests" / "test_broken.py", "import nonexistent_mod\n\ndef test_x():\n    pass\n")
+
+    assert not _run_sharded(repo)
+
+
+def test_sharded_run_fails_on_failing_test(repo):
+    """A failing test in any shard fails the run"""
+    _write(repo / "tests" / "test_fail.py", "def test_bad():\n    assert False\n")
+
+    assert not _run_sharded(repo)